@@ -3,165 +3,219 @@
 Usage: python rescore.py
 """
 
-import json
+import functools
 import sys
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 
+import orjson
+
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 from mcp_scorecard.config import VERIFIED_PUBLISHERS  # noqa: E402
 from mcp_scorecard.scoring.targets import infer_targets  # noqa: E402
 
+# Bucket tables: ascending thresholds plus one (value, level) per bucket, so
+# each lookup is a single bisect instead of an if/elif ladder.
+# "{n}" values are filled in with the raw count.
+
+# Secret count: 0 / 1-2 / 3-4 / 5+  (bisect_left → "<=" boundaries)
+SECRETS_KEYS = (0, 2, 4)
+SECRETS_VALS = (
+    ("none", "good"),
+    ("{n}", "neutral"),
+    ("{n}", "warning"),
+    ("{n}", "critical"),
+)
+
+# Transport — reverse from point value (bisect_right → ">=" boundaries)
+TRANSPORT_KEYS = (10, 15, 25)
+TRANSPORT_VALS = (
+    ("unknown", "neutral"),
+    ("remote", "neutral"),
+    ("stdio + remote", "neutral"),
+    ("stdio", "good"),
+)
+
+# Credentials — reverse from point value (bisect_right)
+CREDENTIALS_KEYS = (15, 20)
+CREDENTIALS_VALS = (
+    ("sensitive", "critical"),
+    ("API keys", "neutral"),
+    ("none", "good"),
+)
+
+# Last push recency fraction, for pushes within the past year (bisect_right)
+PUSH_RECENCY_KEYS = (0.5, 0.9)
+PUSH_RECENCY_VALS = (
+    ("< 1 year", "warning"),
+    ("< 6 months", "neutral"),
+    ("< 30 days", "good"),
+)
+
+# Active commit weeks (bisect_right)
+COMMIT_WEEKS_KEYS = (1, 5, 27)
+COMMIT_WEEKS_VALS = (
+    ("dormant", "critical"),
+    ("sporadic", "warning"),
+    ("regular", "neutral"),
+    ("active", "good"),
+)
+
+# Contributor count (bisect_right)
+CONTRIBUTORS_KEYS = (2, 4, 10)
+CONTRIBUTORS_VALS = (
+    ("solo", "neutral"),
+    ("small", "neutral"),
+    ("team", "good"),
+    ("community", "good"),
+)
+
+_FLAG_SEVERITY = {
+    "DEAD_ENTRY": "critical",
+    "NO_SOURCE": "critical",
+    "SENSITIVE_CRED_REQUEST": "critical",
+    "HIGH_SECRET_DEMAND": "warning",
+    "STAGING_ARTIFACT": "warning",
+    "REPO_ARCHIVED": "warning",
+    "TEMPLATE_DESCRIPTION": "info",
+    "DESCRIPTION_DUPLICATE": "info",
+}
+_FLAG_LABELS = {
+    "DEAD_ENTRY": "Dead Entry",
+    "NO_SOURCE": "No Source",
+    "SENSITIVE_CRED_REQUEST": "Sensitive Creds",
+    "HIGH_SECRET_DEMAND": "Many Secrets",
+    "STAGING_ARTIFACT": "Staging Artifact",
+    "REPO_ARCHIVED": "Archived",
+    "TEMPLATE_DESCRIPTION": "Template Desc",
+    "DESCRIPTION_DUPLICATE": "Duplicate Desc",
+}
+_PROV = (
+    ("has_source_repo", "Source Repo"),
+    ("has_license", "License"),
+    ("has_installable_package", "Package"),
+    ("namespace_matches_owner", "NS Match"),
+    ("repo_not_archived", "Active Repo"),
+    ("has_website_url", "Website"),
+    ("has_icon", "Icon"),
+    ("has_security_md", "SECURITY.md"),
+    ("has_code_of_conduct", "Code of Conduct"),
+    ("unique_description", "Unique Desc"),
+)
+_PROV_DEFAULTS = {k: False for k, _ in _PROV}
+
+# Every signal read by generate_badges_from_signals, in a fixed order, so a
+# server's (signals, flags) pair can be reduced to a hashable cache key.
+_SIGNAL_KEYS = (
+    "secret_env_var_count",
+    "transport_type_risk",
+    "credential_sensitivity",
+    "has_source_repo",
+    "has_license",
+    "has_installable_package",
+    "namespace_matches_owner",
+    "repo_not_archived",
+    "has_website_url",
+    "has_icon",
+    "has_security_md",
+    "has_code_of_conduct",
+    "unique_description",
+    "repo_age_over_90d",
+    "last_push_recency",
+    "active_commit_weeks",
+    "contributor_count",
+    "github_stars",
+    "github_forks",
+    "github_watchers",
+)
+_MISSING = object()  # distinguishes an absent signal from an explicit None
+
 
 def generate_badges_from_signals(signals: dict, flags: list[str]) -> dict:
     """Generate badge groups from existing signal values and flags."""
+    _s = signals.get
 
     # --- Security ---
-    security = []
-
-    FLAG_SEVERITY = {
-        "DEAD_ENTRY": "critical",
-        "NO_SOURCE": "critical",
-        "SENSITIVE_CRED_REQUEST": "critical",
-        "HIGH_SECRET_DEMAND": "warning",
-        "STAGING_ARTIFACT": "warning",
-        "REPO_ARCHIVED": "warning",
-        "TEMPLATE_DESCRIPTION": "info",
-        "DESCRIPTION_DUPLICATE": "info",
-    }
-    FLAG_LABELS = {
-        "DEAD_ENTRY": "Dead Entry",
-        "NO_SOURCE": "No Source",
-        "SENSITIVE_CRED_REQUEST": "Sensitive Creds",
-        "HIGH_SECRET_DEMAND": "Many Secrets",
-        "STAGING_ARTIFACT": "Staging Artifact",
-        "REPO_ARCHIVED": "Archived",
-        "TEMPLATE_DESCRIPTION": "Template Desc",
-        "DESCRIPTION_DUPLICATE": "Duplicate Desc",
-    }
-
-    for flag in flags:
-        security.append({
+    security = [
+        {
             "key": flag,
             "type": "flag",
-            "label": FLAG_LABELS.get(flag, flag),
-            "severity": FLAG_SEVERITY.get(flag, "info"),
-        })
+            "label": _FLAG_LABELS.get(flag, flag),
+            "severity": _FLAG_SEVERITY.get(flag, "info"),
+        }
+        for flag in flags
+    ]
+    add_security = security.append
 
     # Secrets
-    sc = signals.get("secret_env_var_count", 0)
-    if sc == 0:
-        val, lvl = "none", "good"
-    elif sc <= 2:
-        val, lvl = str(sc), "neutral"
-    elif sc <= 4:
-        val, lvl = str(sc), "warning"
-    else:
-        val, lvl = str(sc), "critical"
-    security.append({"key": "secrets", "type": "enum", "label": "Secrets", "value": val, "level": lvl})
+    sc = _s("secret_env_var_count", 0)
+    val, lvl = SECRETS_VALS[bisect_left(SECRETS_KEYS, sc)]
+    if sc:
+        val = val.format(n=sc)
+    add_security({"key": "secrets", "type": "enum", "label": "Secrets", "value": val, "level": lvl})
 
     # Transport — reverse from point value
-    tp = signals.get("transport_type_risk", 5)
-    if tp >= 25:
-        t_val, t_lvl = "stdio", "good"
-    elif tp >= 15:
-        t_val, t_lvl = "stdio + remote", "neutral"
-    elif tp >= 10:
-        t_val, t_lvl = "remote", "neutral"
-    else:
-        t_val, t_lvl = "unknown", "neutral"
-    security.append({"key": "transport", "type": "enum", "label": "Transport", "value": t_val, "level": t_lvl})
+    tp = _s("transport_type_risk", 5)
+    t_val, t_lvl = TRANSPORT_VALS[bisect_right(TRANSPORT_KEYS, tp)]
+    add_security({"key": "transport", "type": "enum", "label": "Transport", "value": t_val, "level": t_lvl})
 
     # Credentials
-    cp = signals.get("credential_sensitivity", 20)
-    if cp >= 20:
-        c_val, c_lvl = "none", "good"
-    elif cp >= 15:
-        c_val, c_lvl = "API keys", "neutral"
-    else:
-        c_val, c_lvl = "sensitive", "critical"
-    security.append({"key": "credentials", "type": "enum", "label": "Credentials", "value": c_val, "level": c_lvl})
+    cp = _s("credential_sensitivity", 20)
+    c_val, c_lvl = CREDENTIALS_VALS[bisect_right(CREDENTIALS_KEYS, cp)]
+    add_security({"key": "credentials", "type": "enum", "label": "Credentials", "value": c_val, "level": c_lvl})
 
     # --- Provenance ---
-    PROV = [
-        ("has_source_repo", "Source Repo"),
-        ("has_license", "License"),
-        ("has_installable_package", "Package"),
-        ("namespace_matches_owner", "NS Match"),
-        ("repo_not_archived", "Active Repo"),
-        ("has_website_url", "Website"),
-        ("has_icon", "Icon"),
-        ("has_security_md", "SECURITY.md"),
-        ("has_code_of_conduct", "Code of Conduct"),
-        ("unique_description", "Unique Desc"),
-    ]
+    # One dict merge fills in missing keys instead of a .get() per signal.
+    merged = _PROV_DEFAULTS | signals
     provenance = [
-        {"key": k, "type": "bool", "label": l, "value": bool(signals.get(k, False))}
-        for k, l in PROV
+        {"key": k, "type": "bool", "label": l, "value": bool(merged[k])}
+        for k, l in _PROV
     ]
 
     # --- Activity ---
     activity = []
 
     # Repo age — only have boolean, use what we have
-    aged = signals.get("repo_age_over_90d", False)
+    aged = _s("repo_age_over_90d", False)
     if aged:
         val, lvl = "> 90 days", "good"
-    elif signals.get("has_source_repo", False):
+    elif _s("has_source_repo", False):
         val, lvl = "< 90 days", "new"
     else:
         val, lvl = "no repo", "neutral"
     activity.append({"key": "repo_age", "type": "enum", "label": "Repo Age", "value": val, "level": lvl})
 
     # Last push
-    rec = signals.get("last_push_recency")
-    if rec is not None and rec > 0:
-        if rec >= 0.9:
-            val, lvl = "< 30 days", "good"
-        elif rec >= 0.5:
-            val, lvl = "< 6 months", "neutral"
-        else:
-            val, lvl = "< 1 year", "warning"
-    elif rec is not None:
-        val, lvl = "> 1 year", "critical"
-    else:
+    rec = _s("last_push_recency")
+    if rec is None:
         val, lvl = "unknown", "neutral"
+    elif rec > 0:
+        val, lvl = PUSH_RECENCY_VALS[bisect_right(PUSH_RECENCY_KEYS, rec)]
+    else:
+        val, lvl = "> 1 year", "critical"
     activity.append({"key": "last_push", "type": "enum", "label": "Last Push", "value": val, "level": lvl})
 
     # Commits
-    weeks = signals.get("active_commit_weeks")
+    weeks = _s("active_commit_weeks")
     if weeks is not None:
-        if weeks >= 27:
-            val, lvl = "active", "good"
-        elif weeks >= 5:
-            val, lvl = "regular", "neutral"
-        elif weeks >= 1:
-            val, lvl = "sporadic", "warning"
-        else:
-            val, lvl = "dormant", "critical"
+        val, lvl = COMMIT_WEEKS_VALS[bisect_right(COMMIT_WEEKS_KEYS, weeks)]
     else:
         val, lvl = "unknown", "neutral"
     activity.append({"key": "commit_activity", "type": "enum", "label": "Commits", "value": val, "level": lvl})
 
     # Contributors
-    contribs = signals.get("contributor_count")
+    contribs = _s("contributor_count")
     if contribs is not None:
-        if contribs >= 10:
-            val, lvl = "community", "good"
-        elif contribs >= 4:
-            val, lvl = "team", "good"
-        elif contribs >= 2:
-            val, lvl = "small", "neutral"
-        else:
-            val, lvl = "solo", "neutral"
+        val, lvl = CONTRIBUTORS_VALS[bisect_right(CONTRIBUTORS_KEYS, contribs)]
     else:
         val, lvl = "unknown", "neutral"
     activity.append({"key": "contributors", "type": "enum", "label": "Contributors", "value": val, "level": lvl})
 
     # --- Popularity ---
     popularity = {
-        "stars": signals.get("github_stars", 0),
-        "forks": signals.get("github_forks", 0),
-        "watchers": signals.get("github_watchers", 0),
+        "stars": _s("github_stars", 0),
+        "forks": _s("github_forks", 0),
+        "watchers": _s("github_watchers", 0),
     }
 
     return {
@@ -172,19 +226,45 @@ def generate_badges_from_signals(signals: dict, flags: list[str]) -> dict:
     }
 
 
+def _key(signals: dict, flags: list[str]) -> tuple:
+    """Reduce (signals, flags) to a hashable key for _badges_for_key.
+
+    Flag order is kept as-is since it determines security badge order.
+    """
+    return (tuple(flags), *(signals.get(k, _MISSING) for k in _SIGNAL_KEYS))
+
+
+@functools.lru_cache(maxsize=4096)
+def _badges_for_key(key: tuple) -> dict:
+    """Memoized generate_badges_from_signals over a _key() tuple.
+
+    Many servers share the same signal vector (e.g. no GitHub enrichment),
+    so repeats are served from the cache. The returned dict is shared
+    between callers and must not be mutated.
+    """
+    flags, *values = key
+    signals = {k: v for k, v in zip(_SIGNAL_KEYS, values) if v is not _MISSING}
+    return generate_badges_from_signals(signals, list(flags))
+
+
 def main():
     idx_path = Path("output/index.json")
-    data = json.loads(idx_path.read_text())
+    raw = idx_path.read_bytes()
+    data = orjson.loads(raw)
+    # Keep the file's layout: the pipeline writes compact JSON unless run
+    # with --pretty.
+    options = orjson.OPT_INDENT_2 if raw.startswith(b"{\n") else 0
 
+    # Servers with identical signals/flags share one cached badges dict;
+    # orjson serializes shared references like any other.
+    badges_for, key = _badges_for_key, _key
     for name, server in data["servers"].items():
-        server["badges"] = generate_badges_from_signals(
-            server["signals"], server["flags"]
-        )
-        ns = name.split("/")[0] if "/" in name else ""
-        server["verified_publisher"] = ns in VERIFIED_PUBLISHERS
+        server["badges"] = badges_for(key(server["signals"], server["flags"]))
+        ns, sep, _ = name.partition("/")
+        server["verified_publisher"] = bool(sep) and ns in VERIFIED_PUBLISHERS
         server["targets"] = infer_targets(name)
 
-    idx_path.write_text(json.dumps(data, indent=2))
+    idx_path.write_bytes(orjson.dumps(data, option=options))
     print(f"Added badges to {len(data['servers'])} servers in {idx_path}")
 
 
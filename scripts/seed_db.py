@@ -8,12 +8,12 @@ Requires SUPABASE_URL and SUPABASE_KEY (service role) in .env or environment.
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 from supabase import create_client
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -37,8 +37,7 @@ def load_index() -> dict:
     if not path.exists():
         print(f"ERROR: {path} not found. Run the pipeline first.")
         sys.exit(1)
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
 def load_github_cache() -> dict:
@@ -47,8 +46,7 @@ def load_github_cache() -> dict:
     if not path.exists():
         print(f"WARNING: {path} not found. Skipping enrichment seed.")
         return {}
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
 def batch_upsert(table, rows: list[dict], client, on_conflict: str):
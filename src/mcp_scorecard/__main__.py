@@ -5,6 +5,16 @@ from __future__ import annotations
 import argparse
 import asyncio
 import sys
+from collections.abc import Callable
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop constructor when installed, else None (stdlib loop)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 def main() -> None:
@@ -17,12 +27,23 @@ def main() -> None:
         default=None,
         help="Output directory (default: ./output)",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent output JSON for reading (default: compact)",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Also write a gzipped copy of each output file (index.json.gz, ...)",
+    )
     args = parser.parse_args()
 
     from mcp_scorecard.pipeline import run
 
     try:
-        asyncio.run(run(output_dir=args.output))
+        with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+            runner.run(run(output_dir=args.output, pretty=args.pretty, compress=args.gzip))
     except KeyboardInterrupt:
         print("\nAborted.")
         sys.exit(1)
@@ -6,11 +6,15 @@ filtered to isLatest == True only.
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from typing import Any, TypedDict
 
 import httpx
+import orjson
 
 from mcp_scorecard import config
+from mcp_scorecard.http_client import get_client
 
 
 class EnvVar(TypedDict):
@@ -40,16 +44,29 @@ class ServerEntry(TypedDict):
     server_id: str
 
 
-def _normalize(entry: dict[str, Any]) -> ServerEntry:
-    """Flatten a raw registry entry into a ServerEntry dict."""
+_OFFICIAL_META_KEY = "io.modelcontextprotocol.registry/official"
+
+
+def _official(entry: dict[str, Any]) -> dict[str, Any]:
+    """Return the registry's official _meta block for an entry ({} if absent)."""
+    return entry.get("_meta", {}).get(_OFFICIAL_META_KEY, {})
+
+
+def _normalize(entry: dict[str, Any], official: dict[str, Any]) -> ServerEntry:
+    """Flatten a raw registry entry into a ServerEntry dict.
+
+    `official` is the entry's already-extracted _meta block (see _official),
+    so callers that filtered on isLatest don't walk _meta a second time.
+    """
     server = entry["server"]
-    meta_block = entry.get("_meta", {})
-    official = meta_block.get("io.modelcontextprotocol.registry/official", {})
 
     name: str = server.get("name", "")
-    parts = name.split("/", 1)
-    namespace = parts[0] if len(parts) == 2 else ""
-    server_id = parts[1] if len(parts) == 2 else name
+    namespace, sep, server_id = name.partition("/")
+    if not sep:
+        namespace, server_id = "", name
+    # Low-cardinality strings are interned so the thousands of entries held
+    # in memory share one copy of each namespace / registry / transport type.
+    namespace = sys.intern(namespace)
 
     repo = server.get("repository") or {}
     repo_url = repo.get("url") or None
@@ -60,89 +77,122 @@ def _normalize(entry: dict[str, Any]) -> ServerEntry:
 
     package_types: list[str] = []
     package_identifiers: list[str] = []
-    transport_types: list[str] = []
+    # Insertion-ordered set: O(1) dedup, first-seen order preserved.
+    seen_transports: dict[str, None] = {}
     env_vars: list[EnvVar] = []
 
     for pkg in packages:
         reg_type = pkg.get("registryType")
         if reg_type:
-            package_types.append(reg_type)
+            package_types.append(sys.intern(reg_type))
         identifier = pkg.get("identifier")
         if identifier:
             package_identifiers.append(identifier)
         transport = pkg.get("transport") or {}
         t_type = transport.get("type")
-        if t_type and t_type not in transport_types:
-            transport_types.append(t_type)
+        if t_type:
+            seen_transports.setdefault(sys.intern(t_type), None)
         for ev in pkg.get("environmentVariables") or []:
-            env_vars.append(
-                EnvVar(
-                    name=ev.get("name", ""),
-                    is_required=bool(ev.get("isRequired", False)),
-                    is_secret=bool(ev.get("isSecret", False)),
-                )
-            )
+            env_vars.append({
+                "name": ev.get("name", ""),
+                "is_required": bool(ev.get("isRequired", False)),
+                "is_secret": bool(ev.get("isSecret", False)),
+            })
 
     for remote in remotes:
         r_type = remote.get("type")
-        if r_type and r_type not in transport_types:
-            transport_types.append(r_type)
-
-    return ServerEntry(
-        name=name,
-        title=server.get("title") or None,
-        description=server.get("description", ""),
-        version=server.get("version", ""),
-        repo_url=repo_url,
-        repo_source=repo_source,
-        has_packages=len(packages) > 0,
-        package_types=package_types,
-        package_identifiers=package_identifiers,
-        has_remotes=len(remotes) > 0,
-        transport_types=transport_types,
-        env_vars=env_vars,
-        has_website=bool(server.get("websiteUrl")),
-        has_icon=bool(server.get("icons")),
-        published_at=official.get("publishedAt", ""),
-        updated_at=official.get("updatedAt", ""),
-        namespace=namespace,
-        server_id=server_id,
-    )
-
-
-def _is_latest(entry: dict[str, Any]) -> bool:
-    """Return True if the entry's _meta marks it as isLatest."""
-    meta_block = entry.get("_meta", {})
-    official = meta_block.get("io.modelcontextprotocol.registry/official", {})
-    return bool(official.get("isLatest", False))
+        if r_type:
+            seen_transports.setdefault(sys.intern(r_type), None)
+
+    transport_types = list(seen_transports)
+
+    # Plain dict literal: TypedDict is only a static type, and calling it
+    # goes through dict(**kwargs).
+    return {
+        "name": name,
+        "title": server.get("title") or None,
+        "description": server.get("description", ""),
+        "version": server.get("version", ""),
+        "repo_url": repo_url,
+        "repo_source": repo_source,
+        "has_packages": len(packages) > 0,
+        "package_types": package_types,
+        "package_identifiers": package_identifiers,
+        "has_remotes": len(remotes) > 0,
+        "transport_types": transport_types,
+        "env_vars": env_vars,
+        "has_website": bool(server.get("websiteUrl")),
+        "has_icon": bool(server.get("icons")),
+        "published_at": official.get("publishedAt", ""),
+        "updated_at": official.get("updatedAt", ""),
+        "namespace": namespace,
+        "server_id": server_id,
+    }
+
+
+async def _fetch_page(
+    client: httpx.AsyncClient,
+    url: str,
+    limit: int,
+    cursor: str | None,
+) -> dict[str, Any]:
+    """GET one registry page and return its decoded JSON body."""
+    params: dict[str, str | int] = {"limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    resp = await client.get(url, params=params)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
 
 async def collect() -> list[ServerEntry]:
     """Paginate the MCP registry and return normalized ServerEntry list.
 
     Only entries with isLatest == True are included.
+
+    Pagination is cursor-based, so pages can't be fetched out of order;
+    instead the next page is requested as soon as its cursor is known, and
+    the loop yields once so that request is sent before the current page is
+    normalized. If normalizing fails, the in-flight request is cancelled.
+
+    Requests go through the shared client from http_client; closing it is
+    left to the caller (the pipeline does so when the run ends).
     """
     base_url = config.REGISTRY_BASE_URL
     limit = config.REGISTRY_LIMIT
     url = f"{base_url}/v0/servers"
 
     entries: list[ServerEntry] = []
-    cursor: str | None = None
     page = 0
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        while True:
+    client = await get_client()
+    pending: asyncio.Task[dict[str, Any]] | None = asyncio.create_task(
+        _fetch_page(client, url, limit, None)
+    )
+    try:
+        while pending is not None:
             page += 1
-            params: dict[str, str | int] = {"limit": limit}
-            if cursor:
-                params["cursor"] = cursor
-
-            resp = await client.get(url, params=params)
-            resp.raise_for_status()
-            data = resp.json()
+            data = await pending
 
             servers_raw: list[dict[str, Any]] = data.get("servers", [])
-            batch = [_normalize(e) for e in servers_raw if _is_latest(e)]
+            metadata = data.get("metadata", {})
+            cursor = metadata.get("nextCursor")
+
+            # Look-ahead: start the next request before doing this page's
+            # work. create_task only schedules it, so yield once to let it
+            # get the request on the wire before normalizing blocks the loop.
+            pending = None
+            if cursor and servers_raw:
+                pending = asyncio.create_task(
+                    _fetch_page(client, url, limit, cursor)
+                )
+                await asyncio.sleep(0)
+
+            batch = [
+                _normalize(e, off)
+                for e in servers_raw
+                if (off := _official(e)).get("isLatest", False)
+            ]
             entries.extend(batch)
 
             print(
@@ -150,11 +200,9 @@ async def collect() -> list[ServerEntry]:
                 f"{len(servers_raw)} raw, {len(batch)} latest, "
                 f"{len(entries)} total"
             )
-
-            metadata = data.get("metadata", {})
-            cursor = metadata.get("nextCursor")
-            if not cursor or not servers_raw:
-                break
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
 
     print(f"Registry collection complete: {len(entries)} servers")
     return entries
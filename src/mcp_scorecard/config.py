@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 # --- Category Weights (must sum to 1.0) ---
 CATEGORY_WEIGHTS = {
     "provenance": 0.30,
@@ -59,64 +61,85 @@ PERMISSIONS_POINTS = {
 }
 
 # --- Score Bands ---
-SCORE_BANDS = [
+SCORE_BANDS = (
     (80, 100, "High Trust"),
     (60, 79, "Moderate Trust"),
     (40, 59, "Low Trust"),
     (20, 39, "Very Low Trust"),
     (0, 19, "Unknown/Suspicious"),
-]
+)
 
 # --- Thresholds ---
+# Bracket tables are listed highest-threshold first for readability; each is
+# also exposed as ascending *_KEYS / *_VALS tuples so scorers can pick the
+# bracket with a single bisect_right (see _bisect_table).
+
+
+def _bisect_table(
+    brackets: tuple[tuple[int, float], ...],
+) -> tuple[tuple[int, ...], tuple[float, ...]]:
+    """Split (threshold, value) brackets into ascending key and value tuples.
+
+    VALS[bisect_right(KEYS, n) - 1] is the value of the highest threshold
+    <= n (an index of 0 means n is below every threshold).
+    """
+    ordered = sorted(brackets)
+    return tuple(t for t, _ in ordered), tuple(v for _, v in ordered)
+
 
 # Last push recency: days -> fraction of 25 points
 PUSH_RECENCY_MAX_DAYS = 365  # 0 points if older
 PUSH_RECENCY_FULL_DAYS = 30  # full points if newer
 
 # Contributor count tiers -> fraction of 15 points
-CONTRIBUTOR_TIERS = [
+CONTRIBUTOR_TIERS = (
     (10, 1.0),   # 10+ contributors = full
     (4, 0.75),   # 4-9
     (2, 0.50),   # 2-3
     (1, 0.25),   # solo
-]
+)
+CONTRIBUTOR_KEYS, CONTRIBUTOR_VALS = _bisect_table(CONTRIBUTOR_TIERS)
 
 # Version count tiers
-VERSION_COUNT_TIERS = [
+VERSION_COUNT_TIERS = (
     (101, 5),    # >100 versions = suspicious
     (51, 10),    # >50 versions = slightly suspicious
     (2, 15),     # 2-50 = healthy
     (1, 5),      # single version
     (0, 0),      # no versions
-]
+)
+VERSION_COUNT_KEYS, VERSION_COUNT_VALS = _bisect_table(VERSION_COUNT_TIERS)
 
 # Stars log scale: 0 stars = 0, 1 = 0.1, 10 = 0.4, 100 = 0.6, 1000 = 0.8, 10000+ = 1.0
-STARS_LOG_BRACKETS = [
+STARS_LOG_BRACKETS = (
     (10000, 1.0),
     (1000, 0.8),
     (100, 0.6),
     (10, 0.4),
     (1, 0.1),
     (0, 0.0),
-]
+)
+STARS_KEYS, STARS_VALS = _bisect_table(STARS_LOG_BRACKETS)
 
-FORKS_LOG_BRACKETS = [
+FORKS_LOG_BRACKETS = (
     (1000, 1.0),
     (100, 0.8),
     (50, 0.6),
     (10, 0.4),
     (1, 0.1),
     (0, 0.0),
-]
+)
+FORKS_KEYS, FORKS_VALS = _bisect_table(FORKS_LOG_BRACKETS)
 
-WATCHERS_LOG_BRACKETS = [
+WATCHERS_LOG_BRACKETS = (
     (100, 1.0),
     (50, 0.8),
     (20, 0.6),
     (5, 0.4),
     (1, 0.1),
     (0, 0.0),
-]
+)
+WATCHERS_KEYS, WATCHERS_VALS = _bisect_table(WATCHERS_LOG_BRACKETS)
 
 # Transport risk scores (out of 25)
 TRANSPORT_RISK = {
@@ -142,6 +165,10 @@ SENSITIVE_CREDENTIAL_PATTERNS = [
     "seed_phrase", "mnemonic",
     "ssh_key", "ssl_cert",
 ]
+# Single compiled alternation: one C-level scan per name via .search().
+SENSITIVE_CREDENTIAL_RE = re.compile(
+    "|".join(map(re.escape, SENSITIVE_CREDENTIAL_PATTERNS))
+)
 
 # Credential sensitivity: env var name patterns -> score out of 20
 # none of these patterns = 20 (best)
@@ -151,6 +178,7 @@ API_KEY_PATTERNS = [
     "api_key", "api_token", "access_token", "auth_token",
     "bearer", "secret", "token", "key", "password", "credential",
 ]
+API_KEY_RE = re.compile("|".join(map(re.escape, API_KEY_PATTERNS)))
 
 # --- Template Description Patterns ---
 TEMPLATE_DESCRIPTIONS = [
@@ -168,6 +196,22 @@ TEMPLATE_DESCRIPTIONS = [
     "hello world mcp server",
 ]
 
+
+def _prefix_table(prefixes: list[str]) -> tuple[str, ...]:
+    """Sort prefixes and drop any that extend a shorter one.
+
+    In a sorted, prefix-free table the only entry that can prefix a string
+    is the rightmost one <= it, i.e. TABLE[bisect_right(TABLE, s) - 1].
+    """
+    table: list[str] = []
+    for p in sorted(prefixes):
+        if not (table and p.startswith(table[-1])):
+            table.append(p)
+    return tuple(table)
+
+
+TEMPLATE_PREFIXES = _prefix_table(TEMPLATE_DESCRIPTIONS)
+
 # --- Staging/Test Name Patterns ---
 STAGING_PATTERNS = [
     "test-", "-test", "staging-", "-staging",
@@ -175,6 +219,7 @@ STAGING_PATTERNS = [
     "demo-", "-demo", "sample-", "-sample",
     "temp-", "-temp", "tmp-", "-tmp",
 ]
+STAGING_RE = re.compile("|".join(map(re.escape, STAGING_PATTERNS)))
 
 # --- Registry API ---
 REGISTRY_BASE_URL = "https://registry.modelcontextprotocol.io"
@@ -185,6 +230,19 @@ GITHUB_API_BASE = "https://api.github.com"
 GITHUB_RATE_LIMIT_PER_HOUR = 5000  # authenticated
 GITHUB_RATE_LIMIT_BUFFER = 100     # stop this many before limit
 GITHUB_CONCURRENT_REQUESTS = 10
+# Repo metadata via batched GraphQL queries (needs GITHUB_TOKEN; falls back to
+# per-repo REST without one). Community profile and participation stats have
+# no GraphQL equivalent and always use REST.
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_USE_GRAPHQL = True
+GITHUB_GRAPHQL_BATCH_SIZE = 50  # repositories per query
+GITHUB_GRAPHQL_CONCURRENT_QUERIES = 2  # batches in flight beside the REST workers
+
+# --- HTTP client (shared by the registry collector and GitHub enricher) ---
+HTTP_TIMEOUT = 30.0          # seconds, per request
+HTTP_CONNECT_TIMEOUT = 10.0  # seconds, fail fast on unreachable hosts
+HTTP_MAX_CONNECTIONS = GITHUB_CONCURRENT_REQUESTS * 2  # pool + keep-alive size
+HTTP_KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection stays pooled
 
 # --- Verified Publishers (curated whitelist) ---
 # Namespace must match exactly. Dave curates manually.
@@ -8,7 +8,7 @@ so that multiple runs can build up full coverage within rate limits.
 from __future__ import annotations
 
 import asyncio
-import json
+import operator
 import os
 import re
 import time
@@ -17,9 +17,11 @@ from pathlib import Path
 from typing import TypedDict
 
 import httpx
+import orjson
 
 from mcp_scorecard import config
 from mcp_scorecard.collectors.registry import ServerEntry
+from mcp_scorecard.http_client import get_client
 
 
 class GitHubData(TypedDict, total=False):
@@ -39,17 +41,155 @@ class GitHubData(TypedDict, total=False):
 
 
 # Matches github.com/owner/repo with optional .git suffix and trailing slash.
+# Reference definition of what _parse_repo_url accepts (the tests check the
+# two agree); the parser itself uses plain string operations.
 _GITHUB_RE = re.compile(
     r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/.]+?)(?:\.git)?/?$"
 )
 
+_GITHUB_PREFIXES = ("https://github.com/", "http://github.com/")
+
 
 def _parse_repo_url(url: str) -> tuple[str, str] | None:
     """Extract (owner, repo) from a GitHub URL, or None if not a match."""
-    m = _GITHUB_RE.match(url.strip())
-    if m:
-        return m.group("owner"), m.group("repo")
-    return None
+    url = url.strip()
+    if url.startswith(_GITHUB_PREFIXES[0]):
+        rest = url[len(_GITHUB_PREFIXES[0]) :]
+    elif url.startswith(_GITHUB_PREFIXES[1]):
+        rest = url[len(_GITHUB_PREFIXES[1]) :]
+    else:
+        return None
+    owner, sep, repo = rest.partition("/")
+    if not owner or not sep:
+        return None
+    if repo.endswith("/"):
+        repo = repo[:-1]
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    # Repo names may not contain dots here (same as the regex), which also
+    # rejects leftover suffixes like "name.git.git".
+    if not repo or "/" in repo or "." in repo:
+        return None
+    return owner, repo
+
+
+# Repository fields fetched per alias in a GraphQL metadata batch; see
+# _graphql_to_rest for the mapping back to REST /repos field names.
+_GRAPHQL_REPO_FIELDS = """
+fragment RepoMeta on Repository {
+  stargazerCount
+  forkCount
+  watchers { totalCount }
+  isArchived
+  licenseInfo { spdxId }
+  createdAt
+  pushedAt
+}
+"""
+
+# Sentinel for _enrich_one: repo metadata was not prefetched, fetch via REST.
+_FETCH = object()
+
+# Sentinel body for a 304 Not Modified reply: reuse the cached fields.
+_NOT_MODIFIED = object()
+
+# GitHubData fields filled from each REST endpoint, keyed by the name its
+# ETag is stored under in a cache entry's "_etags" dict.
+_ETAG_FIELDS: dict[str, tuple[str, ...]] = {
+    "repo": (
+        "github_stars",
+        "github_forks",
+        "github_watchers",
+        "github_archived",
+        "github_license",
+        "github_created_at",
+        "github_pushed_at",
+        "github_owner",
+    ),
+    "community": (
+        "github_has_security_md",
+        "github_has_code_of_conduct",
+        "github_health_percentage",
+    ),
+    "participation": (
+        "github_commit_weeks_active",
+        "github_contributors",
+    ),
+}
+
+
+def _conditional_body(
+    resp: httpx.Response | None, etag: str | None
+) -> tuple[object, str | None]:
+    """Decode a (possibly conditional) GET into (body, etag).
+
+    body is the parsed JSON on 200, _NOT_MODIFIED on 304, else None.
+    """
+    if resp is None:
+        return None, None
+    if resp.status_code == 304:
+        return _NOT_MODIFIED, etag
+    if resp.status_code != 200:
+        return None, None
+    return resp.json(), resp.headers.get("ETag")
+
+
+def _build_graphql_query(count: int) -> str:
+    """Build an aliased query for `count` repos, owner/name passed as variables."""
+    params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoMeta }}"
+        for i in range(count)
+    )
+    return f"query({params}) {{\n{fields}\n}}\n{_GRAPHQL_REPO_FIELDS}"
+
+
+def _graphql_to_rest(node: dict | None) -> dict | None:
+    """Reshape a GraphQL repository node into the REST /repos fields we read."""
+    if node is None:
+        return None
+    license_info = node.get("licenseInfo")
+    return {
+        "stargazers_count": node.get("stargazerCount"),
+        "forks_count": node.get("forkCount"),
+        "subscribers_count": (node.get("watchers") or {}).get("totalCount"),
+        "archived": node.get("isArchived"),
+        "license": (
+            {"spdx_id": license_info.get("spdxId")} if license_info else None
+        ),
+        "created_at": node.get("createdAt"),
+        "pushed_at": node.get("pushedAt"),
+    }
+
+
+def _graphql_metas(payload: dict, count: int) -> dict[int, dict | None] | None:
+    """Map a GraphQL batch response to REST-shaped metadata by batch index.
+
+    A resolved alias is reshaped via _graphql_to_rest; one nulled only by
+    NOT_FOUND errors maps to None (no such repo). Aliases hit by any other
+    error (FORBIDDEN, a partial timeout, ...) are left out so the caller
+    fetches them over REST. Returns None if the query produced no data.
+    """
+    data = payload.get("data")
+    if not data:
+        return None
+    # alias -> types of the errors reported under it
+    error_types: dict[str, set[str | None]] = {}
+    for error in payload.get("errors") or []:
+        path = error.get("path") or []
+        if path:
+            error_types.setdefault(path[0], set()).add(error.get("type"))
+    metas: dict[int, dict | None] = {}
+    for i in range(count):
+        alias = f"r{i}"
+        node = data.get(alias)
+        types = error_types.get(alias)
+        if types is None:
+            if node is not None:
+                metas[i] = _graphql_to_rest(node)
+        elif node is None and types == {"NOT_FOUND"}:
+            metas[i] = None
+    return metas
 
 
 class _RateLimitExhausted(Exception):
@@ -67,11 +207,19 @@ class GitHubEnricher:
         }
         if token:
             self._headers["Authorization"] = f"Bearer {token}"
+        # GraphQL rejects anonymous requests, so batching needs a token.
+        self._use_graphql = bool(token) and config.GITHUB_USE_GRAPHQL
 
-        self._semaphore = asyncio.Semaphore(config.GITHUB_CONCURRENT_REQUESTS)
         self._rate_remaining: int | None = None
         self._rate_lock = asyncio.Lock()
         self._exhausted = False
+        # Set once GraphQL refuses (403/429) or its own budget runs low;
+        # remaining batches are then skipped and fall back to REST.
+        self._graphql_stopped = False
+        self._done = 0  # servers finished by run() workers, for progress
+        # Streaming state for run(result_queue=...); see _report().
+        self._result_queue: asyncio.Queue | None = None
+        self._unreported: set[str] = set()
 
     # ------------------------------------------------------------------
     # Rate-limit tracking
@@ -105,24 +253,30 @@ class GitHubEnricher:
         self,
         client: httpx.AsyncClient,
         path: str,
+        etag: str | None = None,
     ) -> httpx.Response | None:
-        """GET a GitHub API path with semaphore and rate-limit checks.
+        """GET a GitHub API path with rate-limit checks.
 
+        With an etag the request is conditional (If-None-Match); GitHub
+        answers 304 without charging the rate limit when nothing changed.
+        Concurrency is bounded by the number of run() workers.
         Returns the Response on success, or None if rate-limited / errored.
         """
         await self._check_rate_limit()
-        async with self._semaphore:
-            try:
-                resp = await client.get(
-                    f"{config.GITHUB_API_BASE}{path}",
-                    headers=self._headers,
-                )
-            except httpx.HTTPError:
-                return None
-            await self._update_rate_limit(resp)
-            if resp.status_code == 403 and self._exhausted:
-                return None
-            return resp
+        headers = self._headers
+        if etag is not None:
+            headers = {**headers, "If-None-Match": etag}
+        try:
+            resp = await client.get(
+                f"{config.GITHUB_API_BASE}{path}",
+                headers=headers,
+            )
+        except httpx.HTTPError:
+            return None
+        await self._update_rate_limit(resp)
+        if resp.status_code == 403 and self._exhausted:
+            return None
+        return resp
 
     # ------------------------------------------------------------------
     # Per-repo fetchers
@@ -133,43 +287,153 @@ class GitHubEnricher:
         client: httpx.AsyncClient,
         owner: str,
         repo: str,
-    ) -> dict | None:
-        resp = await self._get(client, f"/repos/{owner}/{repo}")
-        if resp is None or resp.status_code != 200:
-            return None
-        return resp.json()
+        etag: str | None = None,
+    ) -> tuple[object, str | None]:
+        resp = await self._get(client, f"/repos/{owner}/{repo}", etag)
+        return _conditional_body(resp, etag)
 
     async def _fetch_community_profile(
         self,
         client: httpx.AsyncClient,
         owner: str,
         repo: str,
-    ) -> dict | None:
-        resp = await self._get(client, f"/repos/{owner}/{repo}/community/profile")
-        if resp is None or resp.status_code != 200:
-            return None
-        return resp.json()
+        etag: str | None = None,
+    ) -> tuple[object, str | None]:
+        resp = await self._get(
+            client, f"/repos/{owner}/{repo}/community/profile", etag
+        )
+        return _conditional_body(resp, etag)
 
     async def _fetch_participation(
         self,
         client: httpx.AsyncClient,
         owner: str,
         repo: str,
-    ) -> dict | None:
-        resp = await self._get(client, f"/repos/{owner}/{repo}/stats/participation")
-        if resp is None:
-            return None
+        etag: str | None = None,
+    ) -> tuple[object, str | None]:
+        path = f"/repos/{owner}/{repo}/stats/participation"
+        resp = await self._get(client, path, etag)
         # 202 = GitHub is computing stats; retry once after a short wait.
-        if resp.status_code == 202:
+        if resp is not None and resp.status_code == 202:
             await asyncio.sleep(2)
-            resp = await self._get(
-                client, f"/repos/{owner}/{repo}/stats/participation"
+            resp = await self._get(client, path, etag)
+        return _conditional_body(resp, etag)
+
+    async def _repo_metadata(
+        self,
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        meta: dict | None | object,
+        etag: str | None,
+    ) -> tuple[object, str | None]:
+        """Resolve _enrich_one's `meta` into (body, etag) like the REST fetch.
+
+        `meta` is prefetched metadata, _FETCH, or the in-flight GraphQL batch
+        task covering this repo; a repo the batch didn't resolve, like
+        _FETCH, goes to the REST /repos call.
+        """
+        if isinstance(meta, asyncio.Task):
+            # Shielded: cancelling one enrichment must not cancel the batch
+            # other servers are waiting on.
+            batch = await asyncio.shield(meta)
+            meta = batch.get((owner, repo), _FETCH)
+        if meta is _FETCH:
+            return await self._fetch_repo_metadata(client, owner, repo, etag)
+        return meta, None
+
+    async def _fetch_metadata_graphql(
+        self,
+        client: httpx.AsyncClient,
+        batch: list[tuple[str, str]],
+    ) -> dict[int, dict | None] | None:
+        """Fetch repo metadata for a batch of (owner, repo) in one GraphQL query.
+
+        Returns REST-shaped metadata keyed by batch index (see
+        _graphql_metas), or None if the query as a whole failed so the
+        caller can fall back to REST.
+        """
+        await self._check_rate_limit()
+        if self._graphql_stopped:
+            return None
+        variables: dict[str, str] = {}
+        for i, (owner, repo) in enumerate(batch):
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = repo
+        try:
+            resp = await client.post(
+                config.GITHUB_GRAPHQL_URL,
+                headers=self._headers,
+                json={
+                    "query": _build_graphql_query(len(batch)),
+                    "variables": variables,
+                },
             )
-            if resp is None or resp.status_code != 200:
-                return None
+        except httpx.HTTPError:
+            return None
+        # GraphQL has its own rate-limit budget, tracked apart from REST: a
+        # refusal (rate or secondary limit) or a low budget stops prefetching.
+        if resp.status_code in (403, 429):
+            self._graphql_stopped = True
+            return None
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            if int(remaining) < config.GITHUB_RATE_LIMIT_BUFFER:
+                self._graphql_stopped = True
         if resp.status_code != 200:
             return None
-        return resp.json()
+        try:
+            payload = resp.json()
+        except ValueError:  # proxy/HTML error page served as a 200
+            return None
+        return _graphql_metas(payload, len(batch))
+
+    async def _prefetch_batch(
+        self,
+        client: httpx.AsyncClient,
+        chunk: list[tuple[str, str, str]],
+        slots: asyncio.Semaphore,
+    ) -> dict[tuple[str, str], dict | None]:
+        """Fetch one GraphQL batch, keyed by (owner, repo).
+
+        Repos missing from the result (failed or skipped batches, failed
+        aliases) fall back to the per-repo REST call in _enrich_one.
+        """
+        async with slots:
+            try:
+                metas = await self._fetch_metadata_graphql(
+                    client, [(owner, repo) for _, owner, repo in chunk]
+                )
+            except _RateLimitExhausted:
+                return {}
+        if metas is None:
+            return {}
+        return {
+            (chunk[idx][1], chunk[idx][2]): meta for idx, meta in metas.items()
+        }
+
+    def _start_prefetch(
+        self,
+        client: httpx.AsyncClient,
+        work: list[tuple[str, str, str]],
+    ) -> tuple[list[asyncio.Task], dict[str, asyncio.Task]]:
+        """Start the GraphQL metadata batches for work in the background.
+
+        Returns the batch tasks and, per server name, the task covering it.
+        Batches go out in work order, a few at a time, while the workers
+        already run the REST calls GraphQL can't replace.
+        """
+        slots = asyncio.Semaphore(config.GITHUB_GRAPHQL_CONCURRENT_QUERIES)
+        size = config.GITHUB_GRAPHQL_BATCH_SIZE
+        tasks: list[asyncio.Task] = []
+        by_name: dict[str, asyncio.Task] = {}
+        for i in range(0, len(work), size):
+            chunk = work[i : i + size]
+            task = asyncio.create_task(self._prefetch_batch(client, chunk, slots))
+            tasks.append(task)
+            for name, _, _ in chunk:
+                by_name[name] = task
+        return tasks, by_name
 
     # ------------------------------------------------------------------
     # Single server enrichment
@@ -180,23 +444,54 @@ class GitHubEnricher:
         client: httpx.AsyncClient,
         owner: str,
         repo: str,
+        meta: dict | None | object = _FETCH,
+        cached: dict | None = None,
     ) -> GitHubData:
+        """Enrich one repo.
+
+        `meta` is its prefetched metadata or the GraphQL batch task covering
+        it, if any (see _repo_metadata). `cached` is its previous (stale)
+        cache entry: stored ETags make the REST calls conditional, and
+        endpoints that answer 304 reuse that entry's fields.
+        """
         data = GitHubData()
+        old_etags: dict[str, str] = (cached or {}).get("_etags") or {}
+        etags: dict[str, str] = {}
+        repo_etag: str | None = None
 
-        # Fire all three requests concurrently.
+        # Fire the outstanding requests concurrently.
         try:
-            meta_coro = self._fetch_repo_metadata(client, owner, repo)
-            community_coro = self._fetch_community_profile(client, owner, repo)
-            participation_coro = self._fetch_participation(client, owner, repo)
-
-            meta, community, participation = await asyncio.gather(
-                meta_coro, community_coro, participation_coro
+            community_coro = self._fetch_community_profile(
+                client, owner, repo, old_etags.get("community")
             )
+            participation_coro = self._fetch_participation(
+                client, owner, repo, old_etags.get("participation")
+            )
+            meta_coro = self._repo_metadata(
+                client, owner, repo, meta, old_etags.get("repo")
+            )
+            (
+                (meta, repo_etag),
+                (community, community_etag),
+                (participation, participation_etag),
+            ) = await asyncio.gather(meta_coro, community_coro, participation_coro)
         except _RateLimitExhausted:
             return data
 
+        for group, body, etag in (
+            ("repo", meta, repo_etag),
+            ("community", community, community_etag),
+            ("participation", participation, participation_etag),
+        ):
+            if etag is not None:
+                etags[group] = etag
+            if body is _NOT_MODIFIED:
+                for field in _ETAG_FIELDS[group]:
+                    if field in cached:
+                        data[field] = cached[field]
+
         # --- Repo metadata ---
-        if meta is not None:
+        if meta is not None and meta is not _NOT_MODIFIED:
             data["github_stars"] = meta.get("stargazers_count")
             data["github_forks"] = meta.get("forks_count")
             data["github_watchers"] = meta.get("subscribers_count")
@@ -210,7 +505,7 @@ class GitHubEnricher:
             data["github_owner"] = owner
 
         # --- Community profile ---
-        if community is not None:
+        if community is not None and community is not _NOT_MODIFIED:
             files = community.get("files") or {}
             data["github_has_security_md"] = files.get("security") is not None
             data["github_has_code_of_conduct"] = (
@@ -219,12 +514,12 @@ class GitHubEnricher:
             data["github_health_percentage"] = community.get("health_percentage")
 
         # --- Participation / commit activity ---
-        if participation is not None:
+        if participation is _NOT_MODIFIED:
+            pass  # copied from the cached entry above
+        elif participation is not None:
             all_weeks: list[int] = participation.get("all") or []
             if all_weeks:
-                data["github_commit_weeks_active"] = sum(
-                    1 for w in all_weeks if w > 0
-                )
+                data["github_commit_weeks_active"] = _active_weeks(all_weeks)
                 data["github_contributors"] = _estimate_contributors(
                     all_weeks,
                     participation.get("owner") or [],
@@ -236,44 +531,148 @@ class GitHubEnricher:
             data["github_commit_weeks_active"] = None
             data["github_contributors"] = None
 
+        if etags:
+            data["_etags"] = etags  # type: ignore[typeddict-unknown-key]
         return data
 
+    # ------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------
+
+    def _report(self, name: str, entry: dict | None) -> None:
+        """Put a server's final data on the run()'s result queue, if any."""
+        self._unreported.discard(name)
+        if self._result_queue is not None:
+            self._result_queue.put_nowait(
+                (name, _public_fields(entry) if entry is not None else None)
+            )
+
+    async def _worker(
+        self,
+        client: httpx.AsyncClient,
+        queue: asyncio.Queue[tuple[str, str, str]],
+        results: dict[str, GitHubData],
+        total: int,
+        prefetch: dict[str, asyncio.Task],
+        cache: dict,
+    ) -> None:
+        """Enrich queued repos until the queue is empty or the rate limit trips."""
+        while not self._exhausted:
+            try:
+                name, owner, repo = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            data = await self._enrich_one(
+                client, owner, repo, prefetch.get(name, _FETCH), cache.get(name)
+            )
+            if data:
+                results[name] = data
+            self._report(name, data or cache.get(name))
+            queue.task_done()
+
+            self._done += 1
+            if (
+                self._done % config.GITHUB_CONCURRENT_REQUESTS == 0
+                or self._done == total
+            ):
+                remaining_str = (
+                    str(self._rate_remaining)
+                    if self._rate_remaining is not None
+                    else "unknown"
+                )
+                print(
+                    f"  GitHub enrichment progress: {self._done}/{total} "
+                    f"(rate limit: {remaining_str} remaining)"
+                )
+
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
 
     async def run(
-        self, servers: list[ServerEntry], cache: dict | None = None
+        self,
+        servers: list[ServerEntry],
+        cache: dict | None = None,
+        result_queue: asyncio.Queue[tuple[str, GitHubData | None]] | None = None,
+        now: float | None = None,
     ) -> dict[str, GitHubData]:
         """Enrich servers that have a GitHub repo URL, skipping cached ones.
 
         Returns a dict keyed by server name (only freshly fetched servers).
+        Cache freshness is judged against now (epoch seconds, default: the
+        current time).
+
+        If result_queue is given, every server's final GitHub data (its
+        public cache fields, or None) is put on it as (name, data) as soon
+        as it is known: servers needing no fetch up front, fetched ones as
+        their worker finishes, and any left unfetched when run() returns.
         """
         cache = cache or {}
+        self._result_queue = result_queue
+        if now is None:
+            now = time.time()
 
-        # Build work list, skipping fresh cache entries
-        work: list[tuple[str, str, str]] = []
-        skipped = 0
-        for srv in servers:
-            url = srv.get("repo_url")
-            if not url:
-                continue
-            parsed = _parse_repo_url(url)
-            if parsed is None:
-                continue
-            name = srv["name"]
-            if name in cache and not _is_stale(cache[name]):
-                skipped += 1
-                continue
-            work.append((name, parsed[0], parsed[1]))
+        # The rate-limit probe is a network round trip and the work list is
+        # pure CPU, so build the list in a thread while the probe is in flight.
+        probe = asyncio.create_task(self._probe_rate_limit())
+        try:
+            ready, work, skipped = await asyncio.to_thread(
+                _build_worklist, servers, cache, now
+            )
+        except BaseException:
+            probe.cancel()
+            raise
 
+        for name, entry in ready:
+            self._report(name, entry)
         if skipped:
             print(f"Skipping {skipped} servers with fresh cache entries.")
 
+        self._unreported = {name for name, _, _ in work}
+        try:
+            return await self._fetch_all(work, cache, probe)
+        finally:
+            probe.cancel()
+            # Whatever wasn't fetched keeps its (stale) cached data, if any.
+            for name, _, _ in work:
+                if name in self._unreported:
+                    self._report(name, cache.get(name))
+
+    async def _probe_rate_limit(self) -> bool:
+        """Read the remaining core rate limit with a lightweight call.
+
+        Returns False if the limit is already exhausted.
+        """
+        client = await get_client()
+        try:
+            probe = await self._get(client, "/rate_limit")
+        except _RateLimitExhausted:
+            return False
+        if probe is not None and probe.status_code == 200:
+            core = probe.json().get("resources", {}).get("core", {})
+            self._rate_remaining = core.get("remaining")
+            if (
+                self._rate_remaining is not None
+                and self._rate_remaining < config.GITHUB_RATE_LIMIT_BUFFER
+            ):
+                self._exhausted = True
+        return True
+
+    async def _fetch_all(
+        self,
+        work: list[tuple[str, str, str]],
+        cache: dict,
+        probe: asyncio.Task[bool],
+    ) -> dict[str, GitHubData]:
+        """Fetch every work item through the worker pool; see run()."""
         if not work:
             print("No servers need enrichment (all cached).")
             return {}
 
+        if not await probe:
+            print("Rate limit already exhausted. Skipping GitHub enrichment.")
+            return {}
+
         remaining_str = "unknown"
         if self._rate_remaining is not None:
             remaining_str = str(self._rate_remaining)
@@ -285,63 +684,93 @@ class GitHubEnricher:
 
         results: dict[str, GitHubData] = {}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Pre-check rate limit with a lightweight call.
-            try:
-                probe = await self._get(client, "/rate_limit")
-                if probe is not None and probe.status_code == 200:
-                    core = probe.json().get("resources", {}).get("core", {})
-                    self._rate_remaining = core.get("remaining")
-                    if (
-                        self._rate_remaining is not None
-                        and self._rate_remaining < config.GITHUB_RATE_LIMIT_BUFFER
-                    ):
-                        self._exhausted = True
-                    print(
-                        f"Enriching {len(work)} servers with GitHub repos... "
-                        f"(rate limit: {self._rate_remaining} remaining)"
-                    )
-            except _RateLimitExhausted:
-                print("Rate limit already exhausted. Skipping GitHub enrichment.")
-                return {}
+        client = await get_client()
 
-            # Process in batches sized to the semaphore.
-            batch_size = config.GITHUB_CONCURRENT_REQUESTS
-
-            for i in range(0, len(work), batch_size):
-                if self._exhausted:
-                    print(
-                        f"Rate limit buffer reached after {len(results)} servers. "
-                        "Stopping GitHub enrichment."
-                    )
-                    break
-
-                batch = work[i : i + batch_size]
-                tasks = [
-                    self._enrich_one(client, owner, repo)
-                    for _, owner, repo in batch
-                ]
-                batch_results = await asyncio.gather(*tasks)
-
-                for (name, _, _), data in zip(batch, batch_results):
-                    if data:
-                        results[name] = data
-
-                done = min(i + batch_size, len(work))
-                remaining_str = (
-                    str(self._rate_remaining)
-                    if self._rate_remaining is not None
-                    else "unknown"
-                )
-                print(
-                    f"  GitHub enrichment progress: {done}/{len(work)} "
-                    f"(rate limit: {remaining_str} remaining)"
-                )
+        batches: list[asyncio.Task] = []
+        prefetch: dict[str, asyncio.Task] = {}
+        if self._use_graphql:
+            batches, prefetch = self._start_prefetch(client, work)
+
+        # A fixed pool of workers drains a shared queue, so a slow repo only
+        # holds up its own worker instead of the whole batch it landed in.
+        queue: asyncio.Queue[tuple[str, str, str]] = asyncio.Queue()
+        for item in work:
+            queue.put_nowait(item)
+
+        self._done = 0
+        workers = [
+            asyncio.create_task(
+                self._worker(client, queue, results, len(work), prefetch, cache)
+            )
+            for _ in range(config.GITHUB_CONCURRENT_REQUESTS)
+        ]
+        # Workers exit on an empty queue or once the rate limit trips; items
+        # may be left queued in the latter case, so wait on the workers
+        # rather than queue.join().
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Batches no worker reached (rate limit tripped) are not needed.
+            for task in batches:
+                task.cancel()
+
+        if batches:
+            prefetched = sum(
+                len(task.result())
+                for task in batches
+                if task.done() and not task.cancelled() and task.exception() is None
+            )
+            print(f"  Prefetched metadata for {prefetched} repos via GraphQL")
+
+        if self._exhausted and not queue.empty():
+            print(
+                f"Rate limit buffer reached after {len(results)} servers. "
+                "Stopping GitHub enrichment."
+            )
+
+        # Workers finish out of order; keep results (and the cache) in work order.
+        results = {name: results[name] for name, _, _ in work if name in results}
 
         print(f"GitHub enrichment complete: {len(results)} servers enriched.")
         return results
 
 
+def _build_worklist(
+    servers: list[ServerEntry], cache: dict, now: float
+) -> tuple[list[tuple[str, dict | None]], list[tuple[str, str, str]], int]:
+    """Split servers into those needing no fetch and those to enrich.
+
+    Returns (ready, work, skipped): ready holds (name, cache entry or None)
+    for servers without a parseable GitHub repo or with a fresh cache
+    entry; work holds (name, owner, repo) for the rest; skipped counts the
+    fresh cache entries.
+    """
+    ready: list[tuple[str, dict | None]] = []
+    work: list[tuple[str, str, str]] = []
+    skipped = 0
+    for srv in servers:
+        name = srv["name"]
+        url = srv.get("repo_url")
+        parsed = _parse_repo_url(url) if url else None
+        if parsed is None:
+            ready.append((name, cache.get(name)))
+        elif name in cache and not _is_stale(cache[name], now):
+            skipped += 1
+            ready.append((name, cache[name]))
+        else:
+            work.append((name, parsed[0], parsed[1]))
+    return ready, work, skipped
+
+
+def _active_weeks(weeks: list[int]) -> int:
+    """Count weeks with at least one commit.
+
+    Weekly commit counts are never negative, so this is len minus the zero
+    weeks; list.count runs in C rather than a per-element generator.
+    """
+    return len(weeks) - weeks.count(0)
+
+
 def _estimate_contributors(
     all_weeks: list[int], owner_weeks: list[int]
 ) -> int | None:
@@ -364,13 +793,12 @@ def _estimate_contributors(
     # If owner_weeks is empty or wrong length, fall back to just
     # checking non-zero weeks in all_weeks.
     if not owner_weeks or len(owner_weeks) != len(all_weeks):
-        active = sum(1 for w in all_weeks if w > 0)
+        active = _active_weeks(all_weeks)
         return max(1, active // 10) if active > 0 else None
 
-    other_weeks = sum(
-        1 for a, o in zip(all_weeks, owner_weeks) if a > o
-    )
-    total_active = sum(1 for w in all_weeks if w > 0)
+    # map(operator.gt) compares pairwise in C; True sums as 1.
+    other_weeks = sum(map(operator.gt, all_weeks, owner_weeks))
+    total_active = _active_weeks(all_weeks)
 
     if total_active == 0:
         return None
@@ -395,60 +823,82 @@ def _load_cache() -> dict:
     if not path.exists():
         return {}
     try:
-        with open(path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return orjson.loads(path.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
         return {}
 
 
 def _save_cache(cache: dict) -> None:
-    """Write the GitHub enrichment cache to disk."""
+    """Write the GitHub enrichment cache to disk.
+
+    The cache is written to a sibling temp file in one write and then
+    renamed over the old one, so a crash mid-save can't leave a truncated
+    cache behind.
+    """
     path = Path(config.GITHUB_CACHE_FILE)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(cache, f, separators=(",", ":"))
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(orjson.dumps(cache))
+    os.replace(tmp, path)
 
 
-def _is_stale(entry: dict) -> bool:
-    """Check if a cache entry is older than the max age."""
+def _public_fields(entry: dict) -> GitHubData:
+    """Drop internal bookkeeping keys (_cached_at, _etags) from a cache entry."""
+    return {k: v for k, v in entry.items() if not k.startswith("_")}  # type: ignore[return-value]
+
+
+def _is_stale(entry: dict, now: float | None = None) -> bool:
+    """Check if a cache entry is older than the max age as of now (epoch seconds)."""
     cached_at = entry.get("_cached_at")
     if cached_at is None:
         return True
-    age_days = (time.time() - cached_at) / 86400
+    if now is None:
+        now = time.time()
+    age_days = (now - cached_at) / 86400
     return age_days > config.GITHUB_CACHE_MAX_AGE_DAYS
 
 
-async def enrich(servers: list[ServerEntry]) -> dict[str, GitHubData]:
+async def enrich(
+    servers: list[ServerEntry],
+    result_queue: asyncio.Queue[tuple[str, GitHubData | None] | None] | None = None,
+) -> dict[str, GitHubData]:
     """Main entry point for GitHub enrichment.
 
     Loads cached data, fetches only new/stale servers, merges, saves cache.
 
     Args:
         servers: List of ServerEntry dicts from the registry collector.
+        result_queue: Optional queue that receives (name, data) for every
+            server as soon as its GitHub data is final (see
+            GitHubEnricher.run), followed by a None sentinel.
 
     Returns:
         Dict keyed by server name with GitHubData values.
     """
+    started = time.time()
     cache = _load_cache()
     cached_count = len(cache)
 
+    # Public view of the cache (internal "_" fields stripped), built once at
+    # load and then kept in step with the fresh results below.
+    results: dict[str, GitHubData] = {
+        name: _public_fields(entry) for name, entry in cache.items()
+    }
+
     enricher = GitHubEnricher()
-    fresh = await enricher.run(servers, cache)
+    fresh = await enricher.run(servers, cache, result_queue, now=started)
 
     # Merge fresh results into cache with timestamp
     now = time.time()
     for name, data in fresh.items():
         cache[name] = {**data, "_cached_at": now}
+        results[name] = _public_fields(data)
 
     _save_cache(cache)
 
-    # Return all cached data (strip internal _cached_at field)
-    results: dict[str, GitHubData] = {}
-    for name, entry in cache.items():
-        cleaned = {k: v for k, v in entry.items() if not k.startswith("_")}
-        results[name] = GitHubData(**cleaned)
-
     new_count = len(cache) - cached_count
     print(f"Cache: {new_count} new, {len(cache)} total ({cached_count} from previous runs)")
 
+    if result_queue is not None:
+        result_queue.put_nowait(None)
     return results
@@ -0,0 +1,40 @@
+"""Shared HTTP client.
+
+One pooled, keep-alive HTTP/2 AsyncClient is reused by the registry collector
+and the GitHub enricher, so connections (and their TLS handshakes) carry over
+between requests and stages. The pipeline closes it when the run ends.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+from mcp_scorecard import config
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use (or after close)."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(
+                config.HTTP_TIMEOUT, connect=config.HTTP_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=config.HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared client if one is open. Safe to call repeatedly."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
@@ -1,12 +1,17 @@
-"""Pydantic models for scorecard output."""
+"""Dataclass models for scorecard output.
+
+Inputs are already validated by the scoring stage, so these are plain
+slotted dataclasses; orjson serializes them natively, in field order.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from pydantic import BaseModel, Field
 
 
-class Badge(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Badge:
     key: str
     type: str  # "flag", "bool", "enum"
     label: str
@@ -15,80 +20,98 @@ class Badge(BaseModel):
     level: str | None = None  # for enums: "good", "neutral", "warning", "critical", "new"
 
 
-class PopularityMetrics(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PopularityMetrics:
     stars: int = 0
     forks: int = 0
     watchers: int = 0
 
 
-class BadgeGroups(BaseModel):
-    security: list[Badge] = Field(default_factory=list)
-    provenance: list[Badge] = Field(default_factory=list)
-    activity: list[Badge] = Field(default_factory=list)
-    popularity: PopularityMetrics = Field(default_factory=PopularityMetrics)
+@dataclass(slots=True, kw_only=True)
+class BadgeGroups:
+    security: list[Badge] = field(default_factory=list)
+    provenance: list[Badge] = field(default_factory=list)
+    activity: list[Badge] = field(default_factory=list)
+    popularity: PopularityMetrics = field(default_factory=PopularityMetrics)
 
 
-class EnvVarInfo(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class EnvVarInfo:
     name: str
     is_required: bool = False
     is_secret: bool = False
 
 
-class InstallInfo(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class InstallInfo:
     repo_url: str | None = None
     version: str | None = None
-    package_types: list[str] = Field(default_factory=list)
-    package_identifiers: list[str] = Field(default_factory=list)
-    transport_types: list[str] = Field(default_factory=list)
-    env_vars: list[EnvVarInfo] = Field(default_factory=list)
+    package_types: list[str] = field(default_factory=list)
+    package_identifiers: list[str] = field(default_factory=list)
+    transport_types: list[str] = field(default_factory=list)
+    env_vars: list[EnvVarInfo] = field(default_factory=list)
+
 
+@dataclass(slots=True, kw_only=True)
+class CategoryScores:
+    provenance: int  # 0-100
+    maintenance: int  # 0-100
+    popularity: int  # 0-100
+    permissions: int  # 0-100
 
-class ServerScore(BaseModel):
-    trust_score: int = Field(ge=0, le=100)
+
+@dataclass(slots=True, kw_only=True)
+class ServerScore:
+    trust_score: int  # 0-100
     trust_label: str
     scores: CategoryScores
     signals: dict[str, object]
-    flags: list[str] = Field(default_factory=list)
-    badges: BadgeGroups = Field(default_factory=BadgeGroups)
+    flags: list[str] = field(default_factory=list)
+    badges: BadgeGroups = field(default_factory=BadgeGroups)
     verified_publisher: bool = False
-    targets: list[str] = Field(default_factory=list)
-    install: InstallInfo = Field(default_factory=InstallInfo)
-
+    targets: list[str] = field(default_factory=list)
+    install: InstallInfo = field(default_factory=InstallInfo)
 
-class CategoryScores(BaseModel):
-    provenance: int = Field(ge=0, le=100)
-    maintenance: int = Field(ge=0, le=100)
-    popularity: int = Field(ge=0, le=100)
-    permissions: int = Field(ge=0, le=100)
 
-
-class ScorecardIndex(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ScorecardIndex:
     version: str = "1.0.0"
     generated_at: datetime
     server_count: int
     servers: dict[str, ServerScore]
 
 
-class FlagGroup(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class FlagGroup:
     flag: str
     count: int
     servers: list[str]
 
 
-class FlagsIndex(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class FlagsIndex:
     version: str = "1.0.0"
     generated_at: datetime
     flags: list[FlagGroup]
 
 
-class ScoreBand(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ScoreBand:
     label: str
     min_score: int
     max_score: int
     count: int
 
 
-class StatsIndex(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TopServer:
+    name: str
+    trust_score: int
+    trust_label: str
+
+
+@dataclass(slots=True, kw_only=True)
+class StatsIndex:
     version: str = "1.0.0"
     generated_at: datetime
     server_count: int
@@ -99,9 +122,3 @@ class StatsIndex(BaseModel):
     top_servers: list[TopServer]
     average_trust_score: float
     median_trust_score: int
-
-
-class TopServer(BaseModel):
-    name: str
-    trust_score: int
-    trust_label: str
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-import json
-from collections import Counter
+import gzip
+import heapq
+import shutil
+from collections import Counter, defaultdict
+from dataclasses import fields
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import median
 
+import orjson
+
 from mcp_scorecard.config import OUTPUT_DIR, SCORE_BANDS, VERIFIED_PUBLISHERS
 from mcp_scorecard.scoring.targets import infer_targets
 from mcp_scorecard.output.models import (
     Badge,
     BadgeGroups,
     CategoryScores,
+    EnvVarInfo,
     FlagGroup,
     FlagsIndex,
     InstallInfo,
@@ -29,52 +35,116 @@ from mcp_scorecard.output.models import (
 def write_all(
     scored_servers: dict[str, dict],
     output_dir: str | None = None,
+    pretty: bool = False,
+    compress: bool = False,
 ) -> None:
+    """Write index.json, stats.json and flags.json to output_dir.
+
+    Output is compact JSON for the site and other consumers; pretty=True
+    indents it by two spaces for reading or diffing by hand. compress=True
+    also writes a gzipped copy of each file (index.json.gz, ...) next to it.
+    """
     out = Path(output_dir or OUTPUT_DIR)
     out.mkdir(parents=True, exist_ok=True)
 
     now = datetime.now(timezone.utc)
 
-    index = _build_index(scored_servers, now)
-    stats = _build_stats(scored_servers, now)
-    flags = _build_flags(scored_servers, now)
+    index, stats, flags = _build_outputs(scored_servers, now)
 
-    _write_json(out / "index.json", index)
-    _write_json(out / "stats.json", stats)
-    _write_json(out / "flags.json", flags)
+    paths = (out / "index.json", out / "stats.json", out / "flags.json")
+    _write_index(paths[0], index, pretty)
+    _write_json(paths[1], stats, pretty)
+    _write_json(paths[2], flags, pretty)
+    if compress:
+        for path in paths:
+            _write_gzip_copy(path)
 
     print(f"Wrote {len(scored_servers)} servers to {out}/")
 
 
-def _build_index(
+def _build_outputs(
     scored_servers: dict[str, dict], now: datetime
-) -> ScorecardIndex:
-    servers = {}
+) -> tuple[ScorecardIndex, StatsIndex, FlagsIndex]:
+    """Build the index, stats and flags models in one pass over the servers.
+
+    Per-server models and all aggregates are collected in the same loop;
+    the _build_* helpers then only assemble the top-level models.
+    """
+    servers: dict[str, ServerScore] = {}
+    scores: list[int] = []
+    flag_counter: Counter[str] = Counter()
+    flag_groups: defaultdict[str, list[str]] = defaultdict(list)
+    servers_with_repo = 0
+    servers_with_packages = 0
+
     for name, data in scored_servers.items():
-        # Build badge models from raw badge dicts
-        raw_badges = data.get("badges", {})
-        badge_groups = BadgeGroups(
-            security=[Badge(**b) for b in raw_badges.get("security", [])],
-            provenance=[Badge(**b) for b in raw_badges.get("provenance", [])],
-            activity=[Badge(**b) for b in raw_badges.get("activity", [])],
-            popularity=PopularityMetrics(**raw_badges.get("popularity", {})),
-        )
-        ns = name.split("/")[0] if "/" in name else ""
-        # Build install info from pipeline data
-        raw_install = data.get("install", {})
-        install = InstallInfo(**raw_install) if raw_install else InstallInfo()
+        servers[name] = _build_server_score(name, data)
+        scores.append(data["trust_score"])
+        flags = data["flags"]
+        flag_counter.update(flags)
+        for f in flags:
+            flag_groups[f].append(name)
+        signals = data["signals"]
+        if signals.get("has_source_repo"):
+            servers_with_repo += 1
+        if signals.get("has_installable_package"):
+            servers_with_packages += 1
 
-        servers[name] = ServerScore(
-            trust_score=data["trust_score"],
-            trust_label=data["trust_label"],
-            scores=CategoryScores(**data["scores"]),
-            signals=data["signals"],
-            flags=data["flags"],
-            badges=badge_groups,
-            verified_publisher=ns in VERIFIED_PUBLISHERS,
-            targets=infer_targets(name),
-            install=install,
+    return (
+        _build_index(servers, now),
+        _build_stats(
+            scored_servers,
+            scores,
+            flag_counter,
+            servers_with_repo,
+            servers_with_packages,
+            now,
+        ),
+        _build_flags(flag_groups, now),
+    )
+
+
+def _build_server_score(name: str, data: dict) -> ServerScore:
+    # Build badge models from raw badge dicts
+    raw_badges = data.get("badges", {})
+    badge_groups = BadgeGroups(
+        security=[Badge(**b) for b in raw_badges.get("security", [])],
+        provenance=[Badge(**b) for b in raw_badges.get("provenance", [])],
+        activity=[Badge(**b) for b in raw_badges.get("activity", [])],
+        popularity=PopularityMetrics(**raw_badges.get("popularity", {})),
+    )
+    ns = name.split("/")[0] if "/" in name else ""
+    # Build install info from pipeline data
+    raw_install = data.get("install", {})
+    install = (
+        InstallInfo(
+            **{
+                **raw_install,
+                "env_vars": [
+                    EnvVarInfo(**ev) for ev in raw_install.get("env_vars", [])
+                ],
+            }
         )
+        if raw_install
+        else InstallInfo()
+    )
+
+    return ServerScore(
+        trust_score=data["trust_score"],
+        trust_label=data["trust_label"],
+        scores=CategoryScores(**data["scores"]),
+        signals=data["signals"],
+        flags=data["flags"],
+        badges=badge_groups,
+        verified_publisher=ns in VERIFIED_PUBLISHERS,
+        targets=infer_targets(name),
+        install=install,
+    )
+
+
+def _build_index(
+    servers: dict[str, ServerScore], now: datetime
+) -> ScorecardIndex:
     return ScorecardIndex(
         generated_at=now,
         server_count=len(servers),
@@ -82,33 +152,39 @@ def _build_index(
     )
 
 
-def _build_stats(
-    scored_servers: dict[str, dict], now: datetime
-) -> StatsIndex:
-    scores = [d["trust_score"] for d in scored_servers.values()]
-    flag_counter: Counter[str] = Counter()
-    servers_with_repo = 0
-    servers_with_packages = 0
+# Score -> index into SCORE_BANDS, for every score the bands cover.
+_SCORE_BAND_INDEX: dict[int, int] = {
+    score: i
+    for i, (low, high, _label) in enumerate(SCORE_BANDS)
+    for score in range(low, high + 1)
+}
 
-    for data in scored_servers.values():
-        for f in data["flags"]:
-            flag_counter[f] += 1
-        if data["signals"].get("has_source_repo"):
-            servers_with_repo += 1
-        if data["signals"].get("has_installable_package"):
-            servers_with_packages += 1
 
-    # Score distribution by band
-    distribution = []
-    for low, high, label in SCORE_BANDS:
-        count = sum(1 for s in scores if low <= s <= high)
-        distribution.append(
-            ScoreBand(label=label, min_score=low, max_score=high, count=count)
-        )
+def _build_stats(
+    scored_servers: dict[str, dict],
+    scores: list[int],
+    flag_counter: Counter[str],
+    servers_with_repo: int,
+    servers_with_packages: int,
+    now: datetime,
+) -> StatsIndex:
+    # Score distribution by band. Scores are 0-100 integers, so counting
+    # them once (in C) leaves at most ~100 distinct values to drop into
+    # their bands rather than rescanning every server.
+    band_counts = [0] * len(SCORE_BANDS)
+    for score, n in Counter(scores).items():
+        band = _SCORE_BAND_INDEX.get(score)
+        if band is not None:
+            band_counts[band] += n
+    distribution = [
+        ScoreBand(label=label, min_score=low, max_score=high, count=count)
+        for (low, high, label), count in zip(SCORE_BANDS, band_counts)
+    ]
 
-    # Top 25 servers by score
-    sorted_servers = sorted(
-        scored_servers.items(), key=lambda x: x[1]["trust_score"], reverse=True
+    # Top 25 servers by score. nlargest keeps only 25 candidates in its heap
+    # and breaks ties like a stable descending sort (first seen wins).
+    top_servers = heapq.nlargest(
+        25, scored_servers.items(), key=lambda x: x[1]["trust_score"]
     )
     top = [
         TopServer(
@@ -116,7 +192,7 @@ def _build_stats(
             trust_score=data["trust_score"],
             trust_label=data["trust_label"],
         )
-        for name, data in sorted_servers[:25]
+        for name, data in top_servers
     ]
 
     return StatsIndex(
@@ -133,21 +209,72 @@ def _build_stats(
 
 
 def _build_flags(
-    scored_servers: dict[str, dict], now: datetime
+    flag_groups: dict[str, list[str]], now: datetime
 ) -> FlagsIndex:
-    flag_groups: dict[str, list[str]] = {}
-    for name, data in scored_servers.items():
-        for f in data["flags"]:
-            flag_groups.setdefault(f, []).append(name)
-
-    groups = [
-        FlagGroup(flag=flag, count=len(servers), servers=sorted(servers))
-        for flag, servers in sorted(flag_groups.items())
-    ]
+    groups = []
+    for flag, servers in sorted(flag_groups.items()):
+        servers.sort()
+        groups.append(FlagGroup(flag=flag, count=len(servers), servers=servers))
 
     return FlagsIndex(generated_at=now, flags=groups)
 
 
-def _write_json(path: Path, model) -> None:
-    with open(path, "w") as f:
-        f.write(model.model_dump_json(indent=2))
+# orjson serializes the dataclass models and datetimes natively; OPT_UTC_Z
+# writes UTC timestamps with a "Z" suffix.
+_JSON_OPTIONS = orjson.OPT_UTC_Z
+_PRETTY_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z
+
+
+def _write_json(path: Path, model, pretty: bool = False) -> None:
+    options = _PRETTY_JSON_OPTIONS if pretty else _JSON_OPTIONS
+    path.write_bytes(orjson.dumps(model, option=options))
+
+
+def _write_index(path: Path, index: ScorecardIndex, pretty: bool = False) -> None:
+    """Write index.json one server at a time through a buffered file.
+
+    Produces the same bytes as _write_json, but never holds more than one
+    server's JSON in memory. "servers" is the model's last field, so the
+    header is the rest of the model with its closing brace cut off; each
+    server is dumped on its own (re-indented two levels deeper if pretty).
+    """
+    options = _PRETTY_JSON_OPTIONS if pretty else _JSON_OPTIONS
+    header = orjson.dumps(
+        {f.name: getattr(index, f.name) for f in fields(index) if f.name != "servers"},
+        option=options,
+    )
+    if pretty:
+        header, opener, first_sep, sep, colon = (
+            header[: -len(b"\n}")], b',\n  "servers": {', b"\n    ", b",\n    ", b": "
+        )
+        closer = b"\n  }\n}" if index.servers else b"}\n}"
+    else:
+        header, opener, first_sep, sep, colon = header[:-1], b',"servers":{', b"", b",", b":"
+        closer = b"}}"
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(header)
+        f.write(opener)
+        next_sep = first_sep
+        for name, server in index.servers.items():
+            f.write(next_sep)
+            f.write(orjson.dumps(name))
+            f.write(colon)
+            body = orjson.dumps(server, option=options)
+            f.write(body.replace(b"\n", b"\n    ") if pretty else body)
+            next_sep = sep
+        f.write(closer)
+
+
+# Level 4 gets nearly all of the ratio on this repetitive JSON (field names
+# repeat per server) at a fraction of level 9's CPU time.
+_GZIP_LEVEL = 4
+
+
+def _write_gzip_copy(path: Path) -> None:
+    """Write path's contents to path + ".gz", streaming through gzip."""
+    gz_path = path.with_name(path.name + ".gz")
+    # mtime=0 keeps the archive bytes stable across runs with equal content.
+    with open(path, "rb") as src, open(gz_path, "wb") as raw, gzip.GzipFile(
+        filename=path.name, mode="wb", compresslevel=_GZIP_LEVEL, fileobj=raw, mtime=0
+    ) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
@@ -4,17 +4,63 @@ from __future__ import annotations
 
 import asyncio
 import time
+from datetime import UTC, datetime
 from statistics import median
 
-from mcp_scorecard.collectors.registry import collect
-from mcp_scorecard.enrichers.github import enrich
+from mcp_scorecard.collectors.registry import ServerEntry, collect
+from mcp_scorecard.enrichers.github import GitHubData, enrich
+from mcp_scorecard.http_client import close_client
 from mcp_scorecard.output.database import DatabaseWriter
 from mcp_scorecard.output.writer import write_all
 from mcp_scorecard.scoring.calculator import calculate_scores
-from mcp_scorecard.scoring.flags import build_flag_context, detect_flags
+from mcp_scorecard.scoring.categories import server_facts
+from mcp_scorecard.scoring.flags import FlagContext, build_flag_context, detect_flags
+
+
+def _score_server(
+    server: ServerEntry,
+    gh: GitHubData | None,
+    flag_context: FlagContext,
+    now: datetime,
+) -> dict:
+    """Flag and score one server, attaching its install info."""
+    facts = server_facts(server)
+    flags = detect_flags(server, gh, flag_context, facts)
+    result = calculate_scores(server, gh, flags=flags, now=now, facts=facts)
+    result["flags"] = flags
+    result["install"] = {
+        "repo_url": server.get("repo_url"),
+        "version": server.get("version"),
+        "package_types": server.get("package_types", []),
+        "package_identifiers": server.get("package_identifiers", []),
+        "transport_types": server.get("transport_types", []),
+        "env_vars": server.get("env_vars", []),
+    }
+    return result
+
+
+async def _score_as_ready(
+    ready: asyncio.Queue[tuple[str, GitHubData | None] | None],
+    servers: list[ServerEntry],
+    flag_context: FlagContext,
+    now: datetime,
+) -> dict[str, dict]:
+    """Score servers as enrich() finalizes their GitHub data.
+
+    Consumes (name, data) items until the None sentinel; results come back
+    in completion order, keyed by name. Every server is scored as of now.
+    """
+    by_name = {server["name"]: server for server in servers}
+    scored: dict[str, dict] = {}
+    while (item := await ready.get()) is not None:
+        name, gh = item
+        scored[name] = _score_server(by_name[name], gh, flag_context, now)
+    return scored
 
 
-async def run(output_dir: str | None = None) -> None:
+async def run(
+    output_dir: str | None = None, pretty: bool = False, compress: bool = False
+) -> None:
     t0 = time.monotonic()
 
     # Optional database writer (active when SUPABASE_URL is set)
@@ -25,26 +71,44 @@ async def run(output_dir: str | None = None) -> None:
     else:
         print("Database writer: disabled (set SUPABASE_URL to enable)")
 
-    # Stage 1: Collect
-    print("=" * 60)
-    print("STAGE 1: COLLECT")
-    print("=" * 60)
-    servers = await collect()
-    print(f"Collected {len(servers)} servers")
-
-    if db:
-        print("  Writing servers to database...")
-        db.upsert_servers(servers)
-        db.upsert_registry_entries(servers)
-        print(f"  Upserted {len(servers)} servers + registry entries")
-
-    # Stage 2: Enrich
-    print()
-    print("=" * 60)
-    print("STAGE 2: ENRICH")
-    print("=" * 60)
-    github_data = await enrich(servers)
-    print(f"Enriched {len(github_data)} servers with GitHub data")
+    # Stages 1-2 share one pooled HTTP client, closed once both are done.
+    try:
+        # Stage 1: Collect
+        print("=" * 60)
+        print("STAGE 1: COLLECT")
+        print("=" * 60)
+        servers = await collect()
+        print(f"Collected {len(servers)} servers")
+
+        if db:
+            print("  Writing servers to database...")
+            db.upsert_servers(servers)
+            db.upsert_registry_entries(servers)
+            print(f"  Upserted {len(servers)} servers + registry entries")
+
+        # Stage 2: Enrich
+        print()
+        print("=" * 60)
+        print("STAGE 2: ENRICH")
+        print("=" * 60)
+        # Scoring a server only needs its own GitHub data, so stage 3 runs
+        # alongside: each server is scored as soon as enrich() finalizes it
+        # (cached and repo-less servers right away, fetched ones as their
+        # requests complete) instead of after the whole stage.
+        flag_context = build_flag_context(servers)
+        # One clock reading for the run, so age and recency signals don't
+        # drift with when each server's enrichment happened to finish.
+        now = datetime.now(UTC)
+        ready: asyncio.Queue[tuple[str, GitHubData | None] | None] = asyncio.Queue()
+        async with asyncio.TaskGroup() as tg:
+            enriching = tg.create_task(enrich(servers, ready))
+            scoring = tg.create_task(
+                _score_as_ready(ready, servers, flag_context, now)
+            )
+        github_data = enriching.result()
+        print(f"Enriched {len(github_data)} servers with GitHub data")
+    finally:
+        await close_client()
 
     if db:
         print("  Writing enrichments to database...")
@@ -56,24 +120,11 @@ async def run(output_dir: str | None = None) -> None:
     print("=" * 60)
     print("STAGE 3: SCORE")
     print("=" * 60)
-    flag_context = build_flag_context(servers)
-    scored: dict[str, dict] = {}
-
-    for server in servers:
-        name = server["name"]
-        gh = github_data.get(name)
-        flags = detect_flags(server, gh, flag_context)
-        result = calculate_scores(server, gh, flags=flags)
-        result["flags"] = flags
-        result["install"] = {
-            "repo_url": server.get("repo_url"),
-            "version": server.get("version"),
-            "package_types": server.get("package_types", []),
-            "package_identifiers": server.get("package_identifiers", []),
-            "transport_types": server.get("transport_types", []),
-            "env_vars": server.get("env_vars", []),
-        }
-        scored[name] = result
+    # Scored during stage 2 in completion order; restore registry order.
+    streamed = scoring.result()
+    scored: dict[str, dict] = {
+        server["name"]: streamed[server["name"]] for server in servers
+    }
 
     flagged = sum(1 for s in scored.values() if s["flags"])
     print(f"Scored {len(scored)} servers, {flagged} flagged")
@@ -83,7 +134,7 @@ async def run(output_dir: str | None = None) -> None:
     print("=" * 60)
     print("STAGE 4: PUBLISH")
     print("=" * 60)
-    write_all(scored, output_dir)
+    write_all(scored, output_dir, pretty=pretty, compress=compress)
 
     if db:
         print("  Writing scores to database...")
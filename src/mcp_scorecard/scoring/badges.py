@@ -9,6 +9,9 @@ Converts raw signals and flags into presentational badge groups:
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 ServerEntry = dict[str, Any]
@@ -51,6 +54,78 @@ _PROVENANCE_BOOL_SIGNALS = [
     ("unique_description", "Unique Desc"),
 ]
 
+# Prebuilt badge dicts, shared by every server that shows them. Badges are
+# never mutated downstream (the writer copies them into Badge models).
+_FLAG_BADGES = {
+    flag: {
+        "key": flag,
+        "type": "flag",
+        "label": label,
+        "severity": _FLAG_SEVERITY.get(flag, "info"),
+    }
+    for flag, label in _FLAG_LABELS.items()
+}
+
+# (False badge, True badge) per provenance signal, in display order.
+_PROVENANCE_BOOL_BADGES = tuple(
+    (
+        key,
+        tuple(
+            {"key": key, "type": "bool", "label": label, "value": value}
+            for value in (False, True)
+        ),
+    )
+    for key, label in _PROVENANCE_BOOL_SIGNALS
+)
+
+
+@lru_cache(maxsize=1024)
+def _enum_badge(key: str, label: str, value: str, level: str) -> dict:
+    """Shared enum badge dict; enum badges take a small set of values."""
+    return {"key": key, "type": "enum", "label": label, "value": value, "level": level}
+
+
+# Enum badge ladders: (thresholds, outcomes) where outcomes[i] applies once
+# i thresholds are passed. "> N" ladders count thresholds strictly below the
+# value (bisect_left); ">= N" ladders count thresholds at or below it
+# (bisect_right).
+_SECRET_LEVELS = ((1, 3, 5), ("good", "neutral", "warning", "critical"))  # >=
+_CREDENTIAL_LADDER = (  # >=
+    (15, 20),
+    (("sensitive", "critical"), ("API keys", "neutral"), ("none", "good")),
+)
+_REPO_AGE_LADDER = (  # > days
+    (30, 90, 365),
+    (
+        ("< 30 days", "new"),
+        ("> 30 days", "neutral"),
+        ("> 90 days", "good"),
+        ("> 1 year", "good"),
+    ),
+)
+_PUSH_RECENCY_LADDER = (  # >= fraction, for recency > 0
+    (0.5, 0.9),
+    (("< 1 year", "warning"), ("< 6 months", "neutral"), ("< 30 days", "good")),
+)
+_COMMIT_WEEKS_LADDER = (  # >= weeks
+    (1, 5, 27),
+    (
+        ("dormant", "critical"),
+        ("sporadic", "warning"),
+        ("regular", "neutral"),
+        ("active", "good"),
+    ),
+)
+_CONTRIBUTOR_LADDER = (  # >= contributors
+    (2, 4, 10),
+    (
+        ("solo", "neutral"),
+        ("small", "neutral"),
+        ("team", "good"),
+        ("community", "good"),
+    ),
+)
+
 _LICENSE_CATEGORY_DISPLAY = {
     "permissive": ("permissive", "good"),
     "copyleft": ("copyleft", "neutral"),
@@ -64,12 +139,16 @@ def generate_badges(
     flags: list[str],
     server: ServerEntry,
     github: GitHubData | None,
+    now: datetime | None = None,
 ) -> dict[str, Any]:
-    """Generate badge groups from scoring signals, flags, and raw data."""
+    """Generate badge groups from scoring signals, flags, and raw data.
+
+    Repo age badges are measured up to now (default: current UTC time).
+    """
     return {
         "security": _security_badges(signals, flags, server),
         "provenance": _provenance_badges(signals),
-        "activity": _activity_badges(signals, github),
+        "activity": _activity_badges(signals, github, now),
         "popularity": _popularity_metrics(signals),
     }
 
@@ -78,34 +157,19 @@ def _security_badges(
     signals: dict, flags: list[str], server: ServerEntry
 ) -> list[dict]:
     """Red flags and permission concerns."""
-    badges: list[dict] = []
-
     # Red flags as badges
-    for flag in flags:
-        badges.append({
-            "key": flag,
-            "type": "flag",
-            "label": _FLAG_LABELS.get(flag, flag),
-            "severity": _FLAG_SEVERITY.get(flag, "info"),
-        })
+    badges: list[dict] = [
+        _FLAG_BADGES.get(flag)
+        or {"key": flag, "type": "flag", "label": flag, "severity": "info"}
+        for flag in flags
+    ]
 
     # Secret count
     secret_count = signals.get("secret_env_var_count", 0)
-    if secret_count == 0:
-        val, level = "none", "good"
-    elif secret_count <= 2:
-        val, level = str(secret_count), "neutral"
-    elif secret_count <= 4:
-        val, level = str(secret_count), "warning"
-    else:
-        val, level = str(secret_count), "critical"
-    badges.append({
-        "key": "secrets",
-        "type": "enum",
-        "label": "Secrets",
-        "value": val,
-        "level": level,
-    })
+    thresholds, levels = _SECRET_LEVELS
+    val = str(secret_count) if secret_count else "none"
+    level = levels[bisect_right(thresholds, secret_count)]
+    badges.append(_enum_badge("secrets", "Secrets", val, level))
 
     # Transport type — use actual types from server entry
     transport_types = server.get("transport_types") or []
@@ -117,29 +181,13 @@ def _security_badges(
         t_val, t_level = "stdio + remote", "neutral"
     else:
         t_val, t_level = "remote", "neutral"
-    badges.append({
-        "key": "transport",
-        "type": "enum",
-        "label": "Transport",
-        "value": t_val,
-        "level": t_level,
-    })
+    badges.append(_enum_badge("transport", "Transport", t_val, t_level))
 
     # Credential sensitivity
     cred_pts = signals.get("credential_sensitivity", 20)
-    if cred_pts >= 20:
-        c_val, c_level = "none", "good"
-    elif cred_pts >= 15:
-        c_val, c_level = "API keys", "neutral"
-    else:
-        c_val, c_level = "sensitive", "critical"
-    badges.append({
-        "key": "credentials",
-        "type": "enum",
-        "label": "Credentials",
-        "value": c_val,
-        "level": c_level,
-    })
+    thresholds, outcomes = _CREDENTIAL_LADDER
+    c_val, c_level = outcomes[bisect_right(thresholds, cred_pts)]
+    badges.append(_enum_badge("credentials", "Credentials", c_val, c_level))
 
     return badges
 
@@ -156,27 +204,20 @@ def _provenance_badges(signals: dict) -> list[dict]:
     )
     # Show the actual license ID when known (e.g. "MIT" not just "permissive")
     label_detail = lic_spdx if lic_spdx and lic_spdx != "NOASSERTION" else display_val
-    badges.append({
-        "key": "license",
-        "type": "enum",
-        "label": "License",
-        "value": label_detail,
-        "level": level,
-    })
+    badges.append(_enum_badge("license", "License", label_detail, level))
 
     # Boolean badges for remaining provenance signals
-    for key, label in _PROVENANCE_BOOL_SIGNALS:
-        badges.append({
-            "key": key,
-            "type": "bool",
-            "label": label,
-            "value": bool(signals.get(key, False)),
-        })
+    badges.extend(
+        variants[bool(signals.get(key, False))]
+        for key, variants in _PROVENANCE_BOOL_BADGES
+    )
 
     return badges
 
 
-def _activity_badges(signals: dict, github: GitHubData | None) -> list[dict]:
+def _activity_badges(
+    signals: dict, github: GitHubData | None, now: datetime | None = None
+) -> list[dict]:
     """State-based maturity indicators (enum badges)."""
     badges: list[dict] = []
 
@@ -184,90 +225,45 @@ def _activity_badges(signals: dict, github: GitHubData | None) -> list[dict]:
     if github and github.get("github_created_at"):
         from mcp_scorecard.scoring.categories import _days_since
 
-        age_days = _days_since(github.get("github_created_at"))
+        age_days = _days_since(github.get("github_created_at"), now)
         if age_days is not None:
-            if age_days > 365:
-                val, level = "> 1 year", "good"
-            elif age_days > 90:
-                val, level = "> 90 days", "good"
-            elif age_days > 30:
-                val, level = "> 30 days", "neutral"
-            else:
-                val, level = "< 30 days", "new"
+            thresholds, outcomes = _REPO_AGE_LADDER
+            val, level = outcomes[bisect_left(thresholds, age_days)]
         else:
             val, level = "unknown", "neutral"
     else:
         val, level = "no repo", "neutral"
-    badges.append({
-        "key": "repo_age",
-        "type": "enum",
-        "label": "Repo Age",
-        "value": val,
-        "level": level,
-    })
+    badges.append(_enum_badge("repo_age", "Repo Age", val, level))
 
     # Last push recency — derive from the 0-1 fraction in signals
     recency = signals.get("last_push_recency")
     if recency is not None and recency > 0:
-        if recency >= 0.9:  # ~within 30 days
-            val, level = "< 30 days", "good"
-        elif recency >= 0.5:  # ~within 6 months
-            val, level = "< 6 months", "neutral"
-        else:  # within a year but old
-            val, level = "< 1 year", "warning"
+        # >= 0.9 is ~within 30 days, >= 0.5 ~within 6 months
+        thresholds, outcomes = _PUSH_RECENCY_LADDER
+        val, level = outcomes[bisect_right(thresholds, recency)]
     elif recency is not None:
         val, level = "> 1 year", "critical"
     else:
         val, level = "unknown", "neutral"
-    badges.append({
-        "key": "last_push",
-        "type": "enum",
-        "label": "Last Push",
-        "value": val,
-        "level": level,
-    })
+    badges.append(_enum_badge("last_push", "Last Push", val, level))
 
     # Commit frequency
     weeks = signals.get("active_commit_weeks")
     if weeks is not None:
-        if weeks >= 27:
-            val, level = "active", "good"
-        elif weeks >= 5:
-            val, level = "regular", "neutral"
-        elif weeks >= 1:
-            val, level = "sporadic", "warning"
-        else:
-            val, level = "dormant", "critical"
+        thresholds, outcomes = _COMMIT_WEEKS_LADDER
+        val, level = outcomes[bisect_right(thresholds, weeks)]
     else:
         val, level = "unknown", "neutral"
-    badges.append({
-        "key": "commit_activity",
-        "type": "enum",
-        "label": "Commits",
-        "value": val,
-        "level": level,
-    })
+    badges.append(_enum_badge("commit_activity", "Commits", val, level))
 
     # Contributors
     contribs = signals.get("contributor_count")
     if contribs is not None:
-        if contribs >= 10:
-            val, level = "community", "good"
-        elif contribs >= 4:
-            val, level = "team", "good"
-        elif contribs >= 2:
-            val, level = "small", "neutral"
-        else:
-            val, level = "solo", "neutral"
+        thresholds, outcomes = _CONTRIBUTOR_LADDER
+        val, level = outcomes[bisect_right(thresholds, contribs)]
     else:
         val, level = "unknown", "neutral"
-    badges.append({
-        "key": "contributors",
-        "type": "enum",
-        "label": "Contributors",
-        "value": val,
-        "level": level,
-    })
+    badges.append(_enum_badge("contributors", "Contributors", val, level))
 
     return badges
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
 from typing import Any
 
 from mcp_scorecard.config import CATEGORY_WEIGHTS, SCORE_BANDS
 
 from .badges import generate_badges
 from .categories import (
+    ServerFacts,
     score_maintenance,
     score_permissions,
     score_popularity,
@@ -19,21 +24,36 @@ ServerEntry = dict[str, Any]
 GitHubData = dict[str, Any]
 
 
-def get_trust_label(score: int) -> str:
-    """Map a 0-100 trust score to a human-readable label via SCORE_BANDS."""
+def _band_label(score: int) -> str:
     for low, high, label in SCORE_BANDS:
         if low <= score <= high:
             return label
     return "Unknown/Suspicious"
 
 
+# Trust label for every score 0-100, indexed by score.
+_LABEL_BY_SCORE = tuple(_band_label(score) for score in range(101))
+
+
+def get_trust_label(score: int) -> str:
+    """Map a 0-100 trust score to a human-readable label via SCORE_BANDS."""
+    if isinstance(score, int) and 0 <= score <= 100:
+        return _LABEL_BY_SCORE[score]
+    return _band_label(score)
+
+
 def calculate_scores(
     server: ServerEntry,
     github_data: GitHubData | None,
     flags: list[str] | None = None,
+    now: datetime | None = None,
+    facts: ServerFacts | None = None,
 ) -> dict[str, Any]:
     """Run all category scorers, compute weighted aggregate, generate badges.
 
+    Age and recency signals are measured up to now (default: current UTC time).
+    facts is the server's ServerFacts, if already computed for flagging.
+
     Returns:
         {
             "trust_score": int,
@@ -44,10 +64,10 @@ def calculate_scores(
         }
     """
     # Run each category scorer
-    prov_score, prov_signals = score_provenance(server, github_data)
-    maint_score, maint_signals = score_maintenance(server, github_data)
+    prov_score, prov_signals = score_provenance(server, github_data, facts)
+    maint_score, maint_signals = score_maintenance(server, github_data, now)
     pop_score, pop_signals = score_popularity(server, github_data)
-    perm_score, perm_signals = score_permissions(server, github_data)
+    perm_score, perm_signals = score_permissions(server, github_data, facts)
 
     scores = {
         "provenance": prov_score,
@@ -62,12 +82,13 @@ def calculate_scores(
     )
     trust_score = min(round(weighted), 100)
 
-    # Merge all signals
-    signals: dict[str, Any] = {}
-    signals.update(prov_signals)
-    signals.update(maint_signals)
-    signals.update(pop_signals)
-    signals.update(perm_signals)
+    # Merge all signals in one presized build
+    signals: dict[str, Any] = {
+        **prov_signals,
+        **maint_signals,
+        **pop_signals,
+        **perm_signals,
+    }
 
     # Generate contextual badges
     badges = generate_badges(
@@ -75,6 +96,7 @@ def calculate_scores(
         flags=flags or [],
         server=server,
         github=github_data,
+        now=now,
     )
 
     return {
@@ -84,3 +106,82 @@ def calculate_scores(
         "signals": signals,
         "badges": badges,
     }
+
+
+def calculate_scores_bulk(
+    servers: Iterable[ServerEntry],
+    github: Mapping[str, GitHubData],
+    flags: Mapping[str, list[str]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Score a batch of servers, keyed by server name.
+
+    github and flags are keyed by server name; servers missing from either
+    are scored without GitHub data / flags. Each result matches
+    calculate_scores for that server, except the whole batch is measured
+    against a single clock reading, so servers scored together agree on
+    "now" for age and recency signals.
+    """
+    now = datetime.now(UTC)
+    flags = flags or {}
+    return {
+        server["name"]: calculate_scores(
+            server, github.get(server["name"]), flags.get(server["name"]), now
+        )
+        for server in servers
+    }
+
+
+def _score_chunk(
+    servers: list[ServerEntry],
+    github: dict[str, GitHubData],
+    flags: dict[str, list[str]],
+    now: datetime,
+) -> dict[str, dict[str, Any]]:
+    """Worker-process body for calculate_scores_parallel."""
+    return {
+        server["name"]: calculate_scores(
+            server, github.get(server["name"]), flags.get(server["name"]), now
+        )
+        for server in servers
+    }
+
+
+def calculate_scores_parallel(
+    servers: Iterable[ServerEntry],
+    github: Mapping[str, GitHubData],
+    flags: Mapping[str, list[str]] | None = None,
+    workers: int | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Score a batch like calculate_scores_bulk, split across worker processes.
+
+    Scoring is pure-Python CPU work, so separate processes sidestep the GIL.
+    The batch is cut into one contiguous chunk per worker (default: one per
+    CPU); each chunk ships with only its own GitHub data and flags. Process
+    start-up and pickling make this pay off only for large batches.
+    """
+    servers = list(servers)
+    flags = flags or {}
+    workers = workers or os.cpu_count() or 1
+    now = datetime.now(UTC)
+    size = max(-(-len(servers) // workers), 1)
+
+    results: dict[str, dict[str, Any]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for start in range(0, len(servers), size):
+            chunk = servers[start : start + size]
+            names = [server["name"] for server in chunk]
+            futures.append(
+                pool.submit(
+                    _score_chunk,
+                    chunk,
+                    {name: github[name] for name in names if name in github},
+                    {name: flags[name] for name in names if name in flags},
+                    now,
+                )
+            )
+        # Chunks are contiguous and collected in submission order, so
+        # results keep the input order.
+        for future in futures:
+            results.update(future.result())
+    return results
@@ -6,26 +6,31 @@ returning (score: int 0-100, signals: dict).
 
 from __future__ import annotations
 
-import re
+from bisect import bisect_right
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from mcp_scorecard.config import (
-    API_KEY_PATTERNS,
-    CONTRIBUTOR_TIERS,
-    FORKS_LOG_BRACKETS,
+    API_KEY_RE,
+    CONTRIBUTOR_KEYS,
+    CONTRIBUTOR_VALS,
+    FORKS_KEYS,
+    FORKS_VALS,
     PACKAGE_TYPE_RISK,
     PACKAGE_TYPE_RISK_DEFAULT,
     POPULARITY_GITHUB_ONLY_POINTS,
     PROVENANCE_POINTS,
     PUSH_RECENCY_FULL_DAYS,
     PUSH_RECENCY_MAX_DAYS,
-    SENSITIVE_CREDENTIAL_PATTERNS,
-    STARS_LOG_BRACKETS,
-    TEMPLATE_DESCRIPTIONS,
+    SENSITIVE_CREDENTIAL_RE,
+    STARS_KEYS,
+    STARS_VALS,
+    TEMPLATE_PREFIXES,
     TRANSPORT_RISK,
     TRANSPORT_RISK_DEFAULT,
-    WATCHERS_LOG_BRACKETS,
+    WATCHERS_KEYS,
+    WATCHERS_VALS,
     classify_license,
 )
 
@@ -34,6 +39,9 @@ ServerEntry = dict[str, Any]
 GitHubData = dict[str, Any]
 
 
+# Each timestamp is parsed at least twice per server (maintenance score and
+# activity badges); datetimes are immutable, so cached results are safe to share.
+@lru_cache(maxsize=4096)
 def _parse_iso(dt_str: str | None) -> datetime | None:
     """Parse an ISO 8601 datetime string, returning None on failure."""
     if not dt_str:
@@ -46,12 +54,13 @@ def _parse_iso(dt_str: str | None) -> datetime | None:
         return None
 
 
-def _days_since(dt_str: str | None) -> float | None:
-    """Return days between now(UTC) and the given ISO datetime string."""
+def _days_since(dt_str: str | None, now: datetime | None = None) -> float | None:
+    """Return days from the given ISO datetime string to now (default: UTC now)."""
     dt = _parse_iso(dt_str)
     if dt is None:
         return None
-    now = datetime.now(UTC)
+    if now is None:
+        now = datetime.now(UTC)
     # Ensure both are offset-aware
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=UTC)
@@ -59,19 +68,83 @@ def _days_since(dt_str: str | None) -> float | None:
     return max(delta.total_seconds() / 86400, 0)
 
 
-def _bracket_score(count: int | None, brackets: list[tuple[int, float]]) -> float:
-    """Find the first bracket where count >= threshold, return its fraction."""
+def _bracket_score(
+    count: int | None, keys: tuple[int, ...], fracs: tuple[float, ...]
+) -> float:
+    """Return the fraction of the highest threshold <= count (0.0 if none)."""
     if count is None:
         return 0.0
-    for threshold, fraction in brackets:
-        if count >= threshold:
-            return fraction
-    return 0.0
+    i = bisect_right(keys, count)
+    return fracs[i - 1] if i else 0.0
 
 
+# Permission points by number of secret env vars; four or more score 0.
+_SECRET_COUNT_POINTS = (40, 30, 20, 10)
+
+_PUSH_RECENCY_SPAN = PUSH_RECENCY_MAX_DAYS - PUSH_RECENCY_FULL_DAYS
+
+
+def scan_env_vars(env_vars: list[dict]) -> tuple[int, int]:
+    """Walk env var dicts once for their secret count and credential sensitivity.
+
+    Returns (secret_count, credential_sensitivity), where the sensitivity
+    is the worst (lowest) across all var names: 20 if none look like
+    credentials, 15 if any look like API keys, 5 if any match a sensitive
+    pattern (wallets, private keys, DB passwords, ...).
+    """
+    secret_count = 0
+    cred_score = 20  # Start with best; degrade per var
+    for ev in env_vars:
+        if ev.get("is_secret"):
+            secret_count += 1
+        if cred_score > 5:  # Can't get worse than 5
+            var_name = (ev.get("name") or "").lower()
+            if SENSITIVE_CREDENTIAL_RE.search(var_name):
+                cred_score = 5
+            elif cred_score > 15 and API_KEY_RE.search(var_name):
+                cred_score = 15
+    return secret_count, cred_score
+
+
+# Descriptions repeat heavily across the registry (boilerplate, templates,
+# bulk publishers), so most lookups hit the cache.
+@lru_cache(maxsize=8192)
+def _is_template_description(desc_key: str) -> bool:
+    """Check if a lowered, stripped description matches a template pattern."""
+    i = bisect_right(TEMPLATE_PREFIXES, desc_key) - 1
+    return bool(desc_key) and i >= 0 and desc_key.startswith(TEMPLATE_PREFIXES[i])
+
+
+class ServerFacts(NamedTuple):
+    """Per-server values needed by both the flag detector and the scorers.
+
+    Compute once via server_facts() and pass to detect_flags() and
+    calculate_scores() so neither re-derives them.
+    """
+
+    desc_key: str  # description, lowered and stripped
+    is_template: bool
+    secret_count: int
+    cred_score: int  # credential sensitivity, see scan_env_vars()
+
+
+def server_facts(server: ServerEntry) -> ServerFacts:
+    """Derive the shared per-server facts from a ServerEntry."""
+    desc_key = (server.get("description") or "").lower().strip()
+    secret_count, cred_score = scan_env_vars(server.get("env_vars") or [])
+    return ServerFacts(
+        desc_key, _is_template_description(desc_key), secret_count, cred_score
+    )
+
+
+_COMPARISON_DROP = str.maketrans("", "", ".-_")
+
+
+# Namespaces and owners recur across every server from the same org.
+@lru_cache(maxsize=4096)
 def _normalize_for_comparison(s: str) -> str:
-    """Lowercase and strip dots/hyphens for fuzzy namespace matching."""
-    return re.sub(r"[.\-_]", "", s.lower().strip())
+    """Lowercase and strip dots/hyphens/underscores for fuzzy namespace matching."""
+    return s.lower().strip().translate(_COMPARISON_DROP)
 
 
 # ---------------------------------------------------------------------------
@@ -80,9 +153,13 @@ def _normalize_for_comparison(s: str) -> str:
 
 
 def score_provenance(
-    server: ServerEntry, github: GitHubData | None
+    server: ServerEntry,
+    github: GitHubData | None,
+    facts: ServerFacts | None = None,
 ) -> tuple[int, dict]:
     """Score provenance signals. Returns (score 0-100, signals dict)."""
+    if facts is None:
+        facts = server_facts(server)
     signals: dict[str, Any] = {}
     points = 0
 
@@ -159,9 +236,7 @@ def score_provenance(
         points += PROVENANCE_POINTS["has_code_of_conduct"]
 
     # unique_description
-    desc = (server.get("description") or "").lower().strip()
-    is_template = any(desc.startswith(t) for t in TEMPLATE_DESCRIPTIONS)
-    unique_desc = bool(desc) and not is_template
+    unique_desc = bool(facts.desc_key) and not facts.is_template
     signals["unique_description"] = unique_desc
     if unique_desc:
         points += PROVENANCE_POINTS["unique_description"]
@@ -175,15 +250,20 @@ def score_provenance(
 
 
 def score_maintenance(
-    server: ServerEntry, github: GitHubData | None
+    server: ServerEntry, github: GitHubData | None, now: datetime | None = None
 ) -> tuple[int, dict]:
-    """Score maintenance signals. Returns (score 0-100, signals dict)."""
+    """Score maintenance signals. Returns (score 0-100, signals dict).
+
+    Repo age and push recency are measured up to now (default: current UTC time).
+    """
     signals: dict[str, Any] = {}
     points = 0.0
 
     # repo_age_over_90d
     age_days = (
-        _days_since(github.get("github_created_at")) if github is not None else None
+        _days_since(github.get("github_created_at"), now)
+        if github is not None
+        else None
     )
     aged = age_days is not None and age_days > 90
     signals["repo_age_over_90d"] = aged
@@ -192,7 +272,7 @@ def score_maintenance(
 
     # last_push_recency — linear scale
     push_days = (
-        _days_since(github.get("github_pushed_at")) if github is not None else None
+        _days_since(github.get("github_pushed_at"), now) if github is not None else None
     )
     if push_days is not None:
         if push_days <= PUSH_RECENCY_FULL_DAYS:
@@ -200,8 +280,8 @@ def score_maintenance(
         elif push_days >= PUSH_RECENCY_MAX_DAYS:
             recency_frac = 0.0
         else:
-            recency_frac = 1.0 - (push_days - PUSH_RECENCY_FULL_DAYS) / (
-                PUSH_RECENCY_MAX_DAYS - PUSH_RECENCY_FULL_DAYS
+            recency_frac = (
+                1.0 - (push_days - PUSH_RECENCY_FULL_DAYS) / _PUSH_RECENCY_SPAN
             )
     else:
         recency_frac = 0.0
@@ -223,12 +303,7 @@ def score_maintenance(
     contributors = (
         github.get("github_contributors") if github is not None else None
     )
-    contrib_frac = 0.0
-    if contributors is not None:
-        for threshold, frac in CONTRIBUTOR_TIERS:
-            if contributors >= threshold:
-                contrib_frac = frac
-                break
+    contrib_frac = _bracket_score(contributors, CONTRIBUTOR_KEYS, CONTRIBUTOR_VALS)
     signals["contributor_count"] = contributors
     points += contrib_frac * 15
 
@@ -258,6 +333,10 @@ def score_maintenance(
 # Popularity (20%)
 # ---------------------------------------------------------------------------
 
+_STARS_POINTS = POPULARITY_GITHUB_ONLY_POINTS["github_stars"]
+_FORKS_POINTS = POPULARITY_GITHUB_ONLY_POINTS["github_forks"]
+_WATCHERS_POINTS = POPULARITY_GITHUB_ONLY_POINTS["github_watchers"]
+
 
 def score_popularity(
     server: ServerEntry, github: GitHubData | None
@@ -274,24 +353,17 @@ def score_popularity(
         signals["github_watchers"] = 0
         return (0, signals)
 
-    pts = POPULARITY_GITHUB_ONLY_POINTS
-
     stars = github.get("github_stars", 0) or 0
-    star_frac = _bracket_score(stars, STARS_LOG_BRACKETS)
-    signals["github_stars"] = stars
-
     forks = github.get("github_forks", 0) or 0
-    fork_frac = _bracket_score(forks, FORKS_LOG_BRACKETS)
-    signals["github_forks"] = forks
-
     watchers = github.get("github_watchers", 0) or 0
-    watcher_frac = _bracket_score(watchers, WATCHERS_LOG_BRACKETS)
+    signals["github_stars"] = stars
+    signals["github_forks"] = forks
     signals["github_watchers"] = watchers
 
     total = (
-        star_frac * pts["github_stars"]
-        + fork_frac * pts["github_forks"]
-        + watcher_frac * pts["github_watchers"]
+        _bracket_score(stars, STARS_KEYS, STARS_VALS) * _STARS_POINTS
+        + _bracket_score(forks, FORKS_KEYS, FORKS_VALS) * _FORKS_POINTS
+        + _bracket_score(watchers, WATCHERS_KEYS, WATCHERS_VALS) * _WATCHERS_POINTS
     )
 
     return (min(round(total), 100), signals)
@@ -302,65 +374,60 @@ def score_popularity(
 # ---------------------------------------------------------------------------
 
 
+# Servers draw their transport and package types from a handful of
+# combinations, so both risk lookups are cached per combination.
+@lru_cache(maxsize=256)
+def _transport_points(transport_types: tuple[str, ...]) -> int:
+    """Transport risk points (higher = safer) for a server's transport types."""
+    if not transport_types:
+        return TRANSPORT_RISK_DEFAULT
+    if "stdio" in transport_types:
+        if len(transport_types) == 1:
+            return TRANSPORT_RISK["stdio"]
+        return 15  # Mixed: stdio + remote
+    # All remote — pick best (highest score) from known types
+    return max(TRANSPORT_RISK.get(t, TRANSPORT_RISK_DEFAULT) for t in transport_types)
+
+
+@lru_cache(maxsize=256)
+def _package_points(pkg_types: tuple[str, ...]) -> int:
+    """Package risk points (higher = safer) for a server's package types."""
+    if not pkg_types:
+        return PACKAGE_TYPE_RISK_DEFAULT
+    # Pick best (highest) risk score from known package types
+    return max(PACKAGE_TYPE_RISK.get(t, PACKAGE_TYPE_RISK_DEFAULT) for t in pkg_types)
+
+
 def score_permissions(
-    server: ServerEntry, github: GitHubData | None
+    server: ServerEntry,
+    github: GitHubData | None,
+    facts: ServerFacts | None = None,
 ) -> tuple[int, dict]:
     """Score permissions risk (higher = safer). Returns (score 0-100, signals dict)."""
     signals: dict[str, Any] = {}
     points = 0
 
-    env_vars = server.get("env_vars") or []
+    if facts is None:
+        facts = server_facts(server)
+    secret_count, cred_score = facts.secret_count, facts.cred_score
 
     # --- secret_env_var_count ---
-    secret_count = sum(1 for ev in env_vars if ev.get("is_secret"))
     signals["secret_env_var_count"] = secret_count
-    secret_score_map = {0: 40, 1: 30, 2: 20, 3: 10}
-    points += secret_score_map.get(secret_count, 0)
+    if secret_count < len(_SECRET_COUNT_POINTS):
+        points += _SECRET_COUNT_POINTS[secret_count]
 
     # --- transport_type_risk ---
-    transport_types = server.get("transport_types") or []
-    if not transport_types:
-        transport_pts = TRANSPORT_RISK_DEFAULT
-    elif "stdio" in transport_types and len(transport_types) == 1:
-        transport_pts = TRANSPORT_RISK["stdio"]
-    elif "stdio" in transport_types:
-        # Mixed: stdio + remote
-        transport_pts = 15
-    else:
-        # All remote — pick best (highest score) from known types
-        remote_scores = [
-            TRANSPORT_RISK.get(t, TRANSPORT_RISK_DEFAULT) for t in transport_types
-        ]
-        transport_pts = max(remote_scores) if remote_scores else TRANSPORT_RISK_DEFAULT
+    transport_pts = _transport_points(tuple(server.get("transport_types") or ()))
     signals["transport_type_risk"] = transport_pts
     points += transport_pts
 
     # --- credential_sensitivity ---
-    # Check all env var names. Worst (lowest score) across all vars wins.
-    if not env_vars:
-        cred_score = 20  # No env vars = safest
-    else:
-        cred_score = 20  # Start with best; degrade per var
-        for ev in env_vars:
-            var_name = (ev.get("name") or "").lower()
-            if any(pat in var_name for pat in SENSITIVE_CREDENTIAL_PATTERNS):
-                cred_score = min(cred_score, 5)
-                break  # Can't get worse
-            if any(pat in var_name for pat in API_KEY_PATTERNS):
-                cred_score = min(cred_score, 15)
+    # Worst (lowest score) across all env var names wins; none = safest.
     signals["credential_sensitivity"] = cred_score
     points += cred_score
 
     # --- package_type_risk ---
-    pkg_types = server.get("package_types") or []
-    if not pkg_types:
-        pkg_score = PACKAGE_TYPE_RISK_DEFAULT
-    else:
-        # Pick best (highest) risk score from known package types
-        pkg_scores = [
-            PACKAGE_TYPE_RISK.get(t, PACKAGE_TYPE_RISK_DEFAULT) for t in pkg_types
-        ]
-        pkg_score = max(pkg_scores) if pkg_scores else PACKAGE_TYPE_RISK_DEFAULT
+    pkg_score = _package_points(tuple(server.get("package_types") or ()))
     signals["package_type_risk"] = pkg_score
     points += pkg_score
 
@@ -7,24 +7,27 @@ regardless of the server's numeric score.
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from typing import Any
 
-from mcp_scorecard.config import (
-    SENSITIVE_CREDENTIAL_PATTERNS,
-    STAGING_PATTERNS,
-    TEMPLATE_DESCRIPTIONS,
-)
+from mcp_scorecard.config import STAGING_RE
+from mcp_scorecard.scoring.categories import ServerFacts, server_facts
 
 # Type aliases
 ServerEntry = dict[str, Any]
 GitHubData = dict[str, Any]
 
+# DESCRIPTION_DUPLICATE fires once a description is used by this many
+# distinct namespaces.
+_DUPLICATE_DESC_NAMESPACES = 3
+
 
 class FlagContext:
     """Pre-computed lookups for flags that need corpus-wide context.
 
     Build once via build_flag_context(), then pass to detect_flags()
-    for each server.
+    for each server. description_ns_counts stops counting at
+    _DUPLICATE_DESC_NAMESPACES, the most the flag needs to know.
     """
 
     __slots__ = ("namespace_counts", "namespace_repo_rates", "description_ns_counts")
@@ -55,8 +58,8 @@ def build_flag_context(all_servers: list[ServerEntry]) -> FlagContext:
     ns_total: dict[str, int] = defaultdict(int)
     # namespace -> count with repo_url
     ns_with_repo: dict[str, int] = defaultdict(int)
-    # description (lowered, stripped) -> set of namespaces
-    desc_namespaces: dict[str, set[str]] = defaultdict(set)
+    # description (lowered, stripped) -> its first few distinct namespaces
+    desc_namespaces: dict[str, tuple[str, ...]] = {}
 
     for s in all_servers:
         ns = s.get("namespace", "")
@@ -66,17 +69,18 @@ def build_flag_context(all_servers: list[ServerEntry]) -> FlagContext:
 
         desc = (s.get("description") or "").lower().strip()
         if desc:
-            desc_namespaces[desc].add(ns)
+            seen = desc_namespaces.get(desc, ())
+            if len(seen) < _DUPLICATE_DESC_NAMESPACES and ns not in seen:
+                desc_namespaces[desc] = seen + (ns,)
 
-    # Compute rates
-    namespace_repo_rates: dict[str, float] = {}
-    for ns, total in ns_total.items():
-        with_repo = ns_with_repo.get(ns, 0)
-        namespace_repo_rates[ns] = with_repo / total if total > 0 else 0.0
+    # Compute rates (every counted namespace has at least one server)
+    namespace_repo_rates: dict[str, float] = {
+        ns: ns_with_repo.get(ns, 0) / total for ns, total in ns_total.items()
+    }
 
-    # Distinct namespace count per description
+    # Distinct namespace count per description (capped)
     description_ns_counts: dict[str, int] = {
-        desc: len(ns_set) for desc, ns_set in desc_namespaces.items()
+        desc: len(seen) for desc, seen in desc_namespaces.items()
     }
 
     return FlagContext(
@@ -86,24 +90,16 @@ def build_flag_context(all_servers: list[ServerEntry]) -> FlagContext:
     )
 
 
-def _is_template_description(desc: str) -> bool:
-    """Check if description matches any template pattern (case-insensitive)."""
-    lowered = desc.lower().strip()
-    if not lowered:
-        return False
-    return any(lowered.startswith(t) for t in TEMPLATE_DESCRIPTIONS)
-
-
 def _matches_staging_pattern(text: str) -> bool:
     """Check if text matches any staging/test name pattern."""
-    lowered = text.lower()
-    return any(pat in lowered for pat in STAGING_PATTERNS)
+    return STAGING_RE.search(text.lower()) is not None
 
 
 def detect_flags(
     server: ServerEntry,
     github: GitHubData | None,
     ctx: FlagContext,
+    facts: ServerFacts | None = None,
 ) -> list[str]:
     """Detect red flags for a single server.
 
@@ -111,11 +107,14 @@ def detect_flags(
         server: The ServerEntry dict.
         github: Optional GitHub enrichment data dict.
         ctx: Pre-computed FlagContext from build_flag_context().
+        facts: The server's ServerFacts, if already computed for scoring.
 
     Returns:
         List of flag name strings (e.g. ["DEAD_ENTRY", "NO_SOURCE"]).
     """
     flags: list[str] = []
+    if facts is None:
+        facts = server_facts(server)
 
     # 1. DEAD_ENTRY — no packages and no remotes, AND no active source repo
     if not server.get("has_packages") and not server.get("has_remotes"):
@@ -129,8 +128,7 @@ def detect_flags(
             flags.append("DEAD_ENTRY")
 
     # 2. TEMPLATE_DESCRIPTION
-    desc = server.get("description") or ""
-    if _is_template_description(desc):
+    if facts.is_template:
         flags.append("TEMPLATE_DESCRIPTION")
 
     # 3. VERSION_FLOOD — stub for v0.1 (only latest version available)
@@ -142,21 +140,16 @@ def detect_flags(
     server_id = server.get("server_id", "")
     if (
         _matches_staging_pattern(name) or _matches_staging_pattern(server_id)
-    ) and _is_template_description(desc):
+    ) and facts.is_template:
         flags.append("STAGING_ARTIFACT")
 
     # 7. HIGH_SECRET_DEMAND — 5+ secret env vars
-    env_vars = server.get("env_vars") or []
-    secret_count = sum(1 for ev in env_vars if ev.get("is_secret"))
-    if secret_count >= 5:
+    if facts.secret_count >= 5:
         flags.append("HIGH_SECRET_DEMAND")
 
     # 8. SENSITIVE_CRED_REQUEST — any env var name matches sensitive patterns
-    for ev in env_vars:
-        var_name = (ev.get("name") or "").lower()
-        if any(pat in var_name for pat in SENSITIVE_CREDENTIAL_PATTERNS):
-            flags.append("SENSITIVE_CRED_REQUEST")
-            break
+    if facts.cred_score == 5:
+        flags.append("SENSITIVE_CRED_REQUEST")
 
     # 9. REPO_ARCHIVED
     if github is not None and github.get("github_archived"):
@@ -171,8 +164,30 @@ def detect_flags(
     # Will be implemented when OSV/advisory data source is integrated.
 
     # 12. DESCRIPTION_DUPLICATE — same description used by >=3 different namespaces
-    desc_key = desc.lower().strip()
-    if desc_key and ctx.description_ns_counts.get(desc_key, 0) >= 3:
+    desc_key = facts.desc_key
+    ns_count = ctx.description_ns_counts.get(desc_key, 0) if desc_key else 0
+    if ns_count >= _DUPLICATE_DESC_NAMESPACES:
         flags.append("DESCRIPTION_DUPLICATE")
 
     return flags
+
+
+def detect_flags_bulk(
+    servers: Iterable[ServerEntry],
+    github: Mapping[str, GitHubData],
+    ctx: FlagContext | None = None,
+) -> dict[str, list[str]]:
+    """Detect red flags for a batch of servers, keyed by server name.
+
+    github is keyed by server name; servers missing from it are checked
+    without GitHub data. ctx defaults to a context built from the batch
+    itself, which is right when the batch is the whole registry. The
+    result plugs straight into calculate_scores_bulk() as its flags.
+    """
+    servers = list(servers)
+    if ctx is None:
+        ctx = build_flag_context(servers)
+    return {
+        server["name"]: detect_flags(server, github.get(server["name"]), ctx)
+        for server in servers
+    }
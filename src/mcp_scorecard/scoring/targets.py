@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 # Canonical platform name → keywords to match in server name/namespace.
 # Order matters: longer/more-specific patterns first to avoid partial matches.
@@ -68,6 +70,56 @@ PLATFORM_KEYWORDS: dict[str, list[str]] = {
     "Bitbucket": ["bitbucket"],
 }
 
+
+def _alternation(words: list[str]) -> str:
+    """Return regex source matching any of words, factored as a prefix trie.
+
+    re tries the branches of a flat alternation one at a time at every
+    position; sharing prefixes ("google-", "google_", "postgres") lets it
+    drop most branches after the first character or two.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # a word ends here
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+# Keyword -> platform, and every keyword in one alternation so a single scan
+# finds them all. The lookarounds give the word boundaries (start/end, or one
+# of -_./ and whitespace) without consuming them, so adjacent keywords like
+# "slack-github" both match, and e.g. "linear" still skips "bilinear".
+# findall reports non-overlapping matches, so no keyword may overlap another
+# at word boundaries (e.g. "google" alongside "google-drive").
+_KEYWORD_PLATFORMS: dict[str, str] = {
+    kw: platform for platform, keywords in PLATFORM_KEYWORDS.items() for kw in keywords
+}
+_KEYWORD_RE = re.compile(
+    r"(?<![^-_./\s])" + _alternation(list(_KEYWORD_PLATFORMS)) + r"(?![^-_./\s])"
+)
+
+# Table position of each platform, so hits can be reported in table order
+# without walking the whole table.
+_PLATFORM_RANK: dict[str, int] = {p: i for i, p in enumerate(PLATFORM_KEYWORDS)}
+
+# "git" alone is too generic for the table; see the special case below.
+_GIT_RE = re.compile(r"(?:^|[-_./\s])git(?:[-_./\s]|$)")
+
 # Namespace prefixes that are hosting platforms, not targets.
 # e.g. io.github.user/slack-mcp → "github" in namespace is NOT a target.
 _HOSTING_NS_PREFIXES = ("io.github.", "ai.smithery")
@@ -90,42 +142,57 @@ def infer_targets(name: str) -> list[str]:
     Args:
         name: Full server name like "io.github.user/slack-mcp-server".
     """
-    parts = name.split("/", 1)
-    ns = parts[0] if len(parts) == 2 else ""
-    server_id = (parts[1] if len(parts) == 2 else name).lower()
+    return list(_infer_targets(name))
+
+
+def infer_targets_many(names: Iterable[str]) -> list[list[str]]:
+    """Return platform targets for each of names, in order.
+
+    Batch form of infer_targets for classifying a whole registry; all names
+    share the compiled keyword scan and the per-name cache.
+    """
+    return [list(_infer_targets(name)) for name in names]
+
+
+# A run infers each name once for the JSON output and again for the database
+# rows; the cache (sized well above the registry) serves the second pass.
+@lru_cache(maxsize=16384)
+def _infer_targets(name: str) -> tuple[str, ...]:
+    """Cached body of infer_targets; a tuple so cached results stay immutable."""
+    ns, sep, server_id = name.partition("/")
+    if not sep:
+        ns, server_id = "", name
+    server_id = server_id.lower()
+
+    # Insertion-ordered set of platforms
+    targets: dict[str, None] = {}
 
     # Build the text to match against.
-    # Exclude hosting namespace prefixes from matching.
+    # Hosting namespaces (most of the registry) and bare names contribute
+    # nothing: they are not targets and have no _NS_PLATFORMS entry, so the
+    # server id alone is the text and the namespace lookup is skipped.
     ns_lower = ns.lower()
-    ns_for_match = ""
-    if not any(ns_lower.startswith(p) for p in _HOSTING_NS_PREFIXES):
-        ns_for_match = ns_lower
-
-    match_text = f"{ns_for_match} {server_id}"
-
-    targets: list[str] = []
-
-    # Check namespace-based platforms first
-    for ns_key, platform in _NS_PLATFORMS.items():
-        if ns_lower == ns_key:
-            targets.append(platform)
-
-    # Keyword matching
-    for platform, keywords in PLATFORM_KEYWORDS.items():
-        if platform in targets:
-            continue
-        for kw in keywords:
-            # Word-boundary match to avoid partial matches
-            # e.g. "linear" shouldn't match "bilinear"
-            if re.search(rf'(?:^|[-_./\s]){re.escape(kw)}(?:[-_./\s]|$)', match_text):
-                targets.append(platform)
-                break
-
-    # Special case: "Git" (too generic) — only match exact patterns
+    if not ns_lower or ns_lower.startswith(_HOSTING_NS_PREFIXES):
+        match_text = server_id
+    else:
+        match_text = f"{ns_lower} {server_id}"
+
+        # Check namespace-based platforms first
+        ns_platform = _NS_PLATFORMS.get(ns_lower)
+        if ns_platform is not None:
+            targets[ns_platform] = None
+
+    # Keyword matching — one scan for all keywords, reported in table order
+    hits = {_KEYWORD_PLATFORMS[kw] for kw in _KEYWORD_RE.findall(match_text)}
+    for platform in sorted(hits, key=_PLATFORM_RANK.__getitem__):
+        targets[platform] = None
+
+    # Special case: "Git" (too generic) — only match exact patterns.
+    # The plain substring test rules out most names before the regex runs.
     if "Git" not in targets:
-        if re.search(r'(?:^|[-_./\s])git(?:[-_./\s]|$)', server_id) and not any(
+        if "git" in server_id and _GIT_RE.search(server_id) and not any(
             p in targets for p in ("GitHub", "GitLab", "Bitbucket")
         ):
-            targets.append("Git")
+            targets["Git"] = None
 
-    return targets
+    return tuple(targets)
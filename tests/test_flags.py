@@ -2,111 +2,96 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from mcp_scorecard.scoring.flags import build_flag_context, detect_flags
+import orjson
+import pytest
+
+from mcp_scorecard.scoring.flags import (
+    build_flag_context,
+    detect_flags,
+    detect_flags_bulk,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-def _load_fixtures() -> list[dict]:
-    with open(FIXTURES / "sample_registry.json") as f:
-        return json.load(f)
+@pytest.fixture(scope="module")
+def servers() -> list[dict]:
+    return orjson.loads((FIXTURES / "sample_registry.json").read_bytes())
 
 
-def _ctx():
-    return build_flag_context(_load_fixtures())
+@pytest.fixture(scope="module")
+def ctx(servers):
+    return build_flag_context(servers)
 
 
 # --- Individual Flag Tests ---
 
 
-def test_dead_entry():
-    servers = _load_fixtures()
+def test_dead_entry(servers, ctx):
     spam = servers[1]  # no packages, no remotes
-    ctx = _ctx()
     flags = detect_flags(spam, None, ctx)
     assert "DEAD_ENTRY" in flags
 
 
-def test_not_dead_with_packages():
-    servers = _load_fixtures()
+def test_not_dead_with_packages(servers, ctx):
     good = servers[0]  # has packages
-    ctx = _ctx()
     flags = detect_flags(good, None, ctx)
     assert "DEAD_ENTRY" not in flags
 
 
-def test_not_dead_with_remotes():
-    servers = _load_fixtures()
+def test_not_dead_with_remotes(servers, ctx):
     smithery = servers[3]  # has remotes
-    ctx = _ctx()
     flags = detect_flags(smithery, None, ctx)
     assert "DEAD_ENTRY" not in flags
 
 
-def test_template_description():
-    servers = _load_fixtures()
+def test_template_description(servers, ctx):
     spam = servers[1]  # "A model context protocol server"
-    ctx = _ctx()
     flags = detect_flags(spam, None, ctx)
     assert "TEMPLATE_DESCRIPTION" in flags
 
 
-def test_no_template_description():
-    servers = _load_fixtures()
+def test_no_template_description(servers, ctx):
     good = servers[0]
-    ctx = _ctx()
     flags = detect_flags(good, None, ctx)
     assert "TEMPLATE_DESCRIPTION" not in flags
 
 
-def test_high_secret_demand():
-    servers = _load_fixtures()
+def test_high_secret_demand(servers, ctx):
     db = servers[2]  # 5 secret env vars
-    ctx = _ctx()
     flags = detect_flags(db, None, ctx)
     assert "HIGH_SECRET_DEMAND" in flags
 
 
-def test_no_high_secret_demand():
-    servers = _load_fixtures()
+def test_no_high_secret_demand(servers, ctx):
     good = servers[0]  # 1 secret env var
-    ctx = _ctx()
     flags = detect_flags(good, None, ctx)
     assert "HIGH_SECRET_DEMAND" not in flags
 
 
-def test_sensitive_cred_request():
-    servers = _load_fixtures()
+def test_sensitive_cred_request(servers, ctx):
     db = servers[2]  # DB_PASSWORD, MASTER_KEY
-    ctx = _ctx()
     flags = detect_flags(db, None, ctx)
     assert "SENSITIVE_CRED_REQUEST" in flags
 
 
-def test_repo_archived():
-    servers = _load_fixtures()
+def test_repo_archived(servers, ctx):
     good = servers[0]
     github = {"github_archived": True}
-    ctx = _ctx()
     flags = detect_flags(good, github, ctx)
     assert "REPO_ARCHIVED" in flags
 
 
-def test_no_source():
-    servers = _load_fixtures()
+def test_no_source(servers, ctx):
     spam = servers[1]  # no repo_url, no package_identifiers
-    ctx = _ctx()
     flags = detect_flags(spam, None, ctx)
     assert "NO_SOURCE" in flags
 
 
-def test_no_source_not_flagged_with_packages():
-    servers = _load_fixtures()
+def test_no_source_not_flagged_with_packages(servers, ctx):
     good = servers[0]  # has repo_url
-    ctx = _ctx()
     flags = detect_flags(good, None, ctx)
     assert "NO_SOURCE" not in flags
 
@@ -114,10 +99,8 @@ def test_no_source_not_flagged_with_packages():
 # --- Multiple Flags ---
 
 
-def test_spam_server_gets_multiple_flags():
-    servers = _load_fixtures()
+def test_spam_server_gets_multiple_flags(servers, ctx):
     spam = servers[1]
-    ctx = _ctx()
     flags = detect_flags(spam, None, ctx)
     assert "DEAD_ENTRY" in flags
     assert "TEMPLATE_DESCRIPTION" in flags
@@ -130,13 +113,25 @@ def test_spam_server_gets_multiple_flags():
 # --- Flag Context ---
 
 
-def test_flag_context_namespace_counts():
-    ctx = _ctx()
+def test_flag_context_namespace_counts(ctx):
     assert ctx.namespace_counts["io.github.example"] == 1
     assert ctx.namespace_counts["ai.spammy"] == 1
 
 
-def test_flag_context_description_ns_counts():
-    ctx = _ctx()
+def test_flag_context_description_ns_counts(ctx):
     # "a model context protocol server" appears in 2 namespaces (ai.spammy, ai.smithery)
     assert ctx.description_ns_counts["a model context protocol server"] == 2
+
+
+# --- Bulk ---
+
+
+def test_bulk_matches_per_server(servers, ctx):
+    github = {servers[0]["name"]: {"github_archived": True}}
+    results = detect_flags_bulk(servers, github)
+
+    assert list(results) == [s["name"] for s in servers]
+    for server in servers:
+        expected = detect_flags(server, github.get(server["name"]), ctx)
+        assert results[server["name"]] == expected
+    assert "REPO_ARCHIVED" in results[servers[0]["name"]]
@@ -0,0 +1,320 @@
+"""Tests for GitHub enricher helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from mcp_scorecard.enrichers.github import (
+    _ETAG_FIELDS,
+    _GITHUB_RE,
+    GitHubEnricher,
+    _build_graphql_query,
+    _graphql_metas,
+    _graphql_to_rest,
+    _parse_repo_url,
+    _public_fields,
+)
+
+
+def _regex_parse(url: str) -> tuple[str, str] | None:
+    m = _GITHUB_RE.match(url.strip())
+    return (m.group("owner"), m.group("repo")) if m else None
+
+
+def test_parse_repo_url_plain():
+    assert _parse_repo_url("https://github.com/owner/repo") == ("owner", "repo")
+
+
+def test_parse_repo_url_suffixes():
+    assert _parse_repo_url("https://github.com/owner/repo.git") == ("owner", "repo")
+    assert _parse_repo_url("https://github.com/owner/repo/") == ("owner", "repo")
+    assert _parse_repo_url("http://github.com/owner/repo.git/") == ("owner", "repo")
+    assert _parse_repo_url("  https://github.com/o.rg/repo \n") == ("o.rg", "repo")
+
+
+def test_parse_repo_url_rejects():
+    assert _parse_repo_url("https://gitlab.com/owner/repo") is None
+    assert _parse_repo_url("https://github.com/owner") is None
+    assert _parse_repo_url("https://github.com/owner/repo/tree/main") is None
+    assert _parse_repo_url("https://github.com/owner/repo.js") is None
+    assert _parse_repo_url("https://github.com//repo") is None
+    assert _parse_repo_url("https://github.com/owner/.git") is None
+    assert _parse_repo_url("git@github.com:owner/repo.git") is None
+
+
+def test_parse_repo_url_matches_regex():
+    urls = [
+        "https://github.com/owner/repo",
+        "https://github.com/owner/repo.git",
+        "https://github.com/owner/repo.git.git",
+        "https://github.com/owner/repo//",
+        "https://github.com/owner/repo/.git",
+        "https://github.com/owner/re.po",
+        "https://www.github.com/owner/repo",
+        "HTTPS://github.com/owner/repo",
+        "https://github.com/owner/repo?tab=readme",
+        "https://github.com/",
+        "",
+    ]
+    for url in urls:
+        assert _parse_repo_url(url) == _regex_parse(url), url
+
+
+# --- GraphQL metadata batches ---
+
+FULL_NODE = {
+    "stargazerCount": 250,
+    "forkCount": 40,
+    "watchers": {"totalCount": 15},
+    "isArchived": False,
+    "licenseInfo": {"spdxId": "MIT"},
+    "createdAt": "2025-01-15T00:00:00Z",
+    "pushedAt": "2026-02-10T00:00:00Z",
+}
+
+
+def _graphql_enricher(handler) -> tuple[GitHubEnricher, httpx.AsyncClient]:
+    enricher = GitHubEnricher()
+    return enricher, httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_build_graphql_query_aliases():
+    query = _build_graphql_query(2)
+    assert query.startswith(
+        "query($o0: String!, $n0: String!, $o1: String!, $n1: String!) {"
+    )
+    assert "r0: repository(owner: $o0, name: $n0) { ...RepoMeta }" in query
+    assert "r1: repository(owner: $o1, name: $n1) { ...RepoMeta }" in query
+    assert "r2:" not in query
+    assert "fragment RepoMeta on Repository" in query
+
+
+def test_graphql_to_rest_full_node():
+    assert _graphql_to_rest(FULL_NODE) == {
+        "stargazers_count": 250,
+        "forks_count": 40,
+        "subscribers_count": 15,
+        "archived": False,
+        "license": {"spdx_id": "MIT"},
+        "created_at": "2025-01-15T00:00:00Z",
+        "pushed_at": "2026-02-10T00:00:00Z",
+    }
+
+
+def test_graphql_to_rest_license_null():
+    meta = _graphql_to_rest({**FULL_NODE, "licenseInfo": None})
+    assert meta["license"] is None
+
+
+def test_graphql_to_rest_watchers_missing():
+    node = {k: v for k, v in FULL_NODE.items() if k != "watchers"}
+    assert _graphql_to_rest(node)["subscribers_count"] is None
+    meta = _graphql_to_rest({**FULL_NODE, "watchers": None})
+    assert meta["subscribers_count"] is None
+
+
+def test_graphql_to_rest_null_node():
+    assert _graphql_to_rest(None) is None
+
+
+def test_graphql_metas_not_found_alias():
+    payload = {
+        "data": {"r0": FULL_NODE, "r1": None},
+        "errors": [{"type": "NOT_FOUND", "path": ["r1"]}],
+    }
+    assert _graphql_metas(payload, 2) == {0: _graphql_to_rest(FULL_NODE), 1: None}
+
+
+def test_graphql_metas_other_errors_fall_back():
+    payload = {
+        "data": {"r0": None, "r1": None, "r2": FULL_NODE, "r3": None},
+        "errors": [
+            {"type": "FORBIDDEN", "path": ["r0"]},
+            {"type": "NOT_FOUND", "path": ["r1"]},
+            {"type": "FORBIDDEN", "path": ["r1"]},
+            {"type": "FORBIDDEN", "path": ["r2", "licenseInfo"]},
+        ],
+    }
+    # Left out, so _enrich_one fetches them over REST; r3 is null with no
+    # error at all, which is not proof the repo is gone either.
+    assert _graphql_metas(payload, 4) == {}
+
+
+def test_graphql_metas_whole_query_failure():
+    assert _graphql_metas({"data": None, "errors": [{"message": "boom"}]}, 2) is None
+    assert _graphql_metas({"errors": [{"message": "timeout"}]}, 2) is None
+
+
+def test_fetch_metadata_graphql_failure_returns_none():
+    async def run():
+        enricher, client = _graphql_enricher(lambda req: httpx.Response(502))
+        async with client:
+            return await enricher._fetch_metadata_graphql(client, [("o", "r")])
+
+    assert asyncio.run(run()) is None
+
+
+def test_fetch_metadata_graphql_non_json_returns_none():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<html>Bad gateway</html>")
+
+    async def run():
+        enricher, client = _graphql_enricher(handler)
+        async with client:
+            return await enricher._fetch_metadata_graphql(client, [("o", "r")])
+
+    assert asyncio.run(run()) is None
+
+
+def test_fetch_metadata_graphql_stops_after_refusal():
+    posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posts.append(request)
+        return httpx.Response(403)
+
+    async def run():
+        enricher, client = _graphql_enricher(handler)
+        async with client:
+            first = await enricher._fetch_metadata_graphql(client, [("o", "r")])
+            second = await enricher._fetch_metadata_graphql(client, [("o", "s")])
+        return first, second
+
+    assert asyncio.run(run()) == (None, None)
+    assert len(posts) == 1
+
+
+# --- ETag revalidation in _enrich_one ---
+
+# Fresh 200 bodies per endpoint group, and a stale cache entry whose values
+# all differ from what those bodies produce.
+FRESH_BODIES = {
+    "repo": {
+        "stargazers_count": 300,
+        "forks_count": 50,
+        "subscribers_count": 20,
+        "archived": False,
+        "license": {"spdx_id": "Apache-2.0"},
+        "created_at": "2025-01-15T00:00:00Z",
+        "pushed_at": "2026-03-01T00:00:00Z",
+    },
+    "community": {
+        "files": {"security": {}, "code_of_conduct": None},
+        "health_percentage": 90,
+    },
+    "participation": {"all": [1, 0, 2] * 17 + [1], "owner": [0] * 52},
+}
+
+STALE_ENTRY = {
+    "github_stars": 250,
+    "github_forks": 40,
+    "github_watchers": 15,
+    "github_archived": True,
+    "github_license": "MIT",
+    "github_created_at": "2024-01-01T00:00:00Z",
+    "github_pushed_at": "2025-06-01T00:00:00Z",
+    "github_owner": "old-owner",
+    "github_contributors": 9,
+    "github_commit_weeks_active": 3,
+    "github_has_security_md": False,
+    "github_has_code_of_conduct": True,
+    "github_health_percentage": 10,
+    "_cached_at": 1.0,
+    "_etags": {
+        "repo": "old-repo",
+        "community": "old-community",
+        "participation": "old-participation",
+    },
+}
+
+
+def _endpoint_group(path: str) -> str:
+    if path.endswith("/community/profile"):
+        return "community"
+    if path.endswith("/stats/participation"):
+        return "participation"
+    return "repo"
+
+
+def _enrich_with(statuses: dict[str, int], cached: dict | None = STALE_ENTRY):
+    """Run _enrich_one for o/r with the given status per endpoint group.
+
+    Returns (data, If-None-Match header sent per group).
+    """
+    sent: dict[str, str | None] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        group = _endpoint_group(request.url.path)
+        sent[group] = request.headers.get("If-None-Match")
+        status = statuses.get(group, 200)
+        if status == 304:
+            return httpx.Response(304)
+        return httpx.Response(
+            status, json=FRESH_BODIES[group], headers={"ETag": f"new-{group}"}
+        )
+
+    async def run():
+        enricher = GitHubEnricher()
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await enricher._enrich_one(client, "o", "r", cached=cached)
+
+    return asyncio.run(run()), sent
+
+
+def test_not_modified_copies_only_its_group():
+    fresh, _ = _enrich_with({})
+    for group, fields in _ETAG_FIELDS.items():
+        data, sent = _enrich_with({group: 304})
+        assert sent[group] == STALE_ENTRY["_etags"][group]
+        for field in fields:
+            assert data[field] == STALE_ENTRY[field], (group, field)
+        for other, other_fields in _ETAG_FIELDS.items():
+            if other != group:
+                for field in other_fields:
+                    assert data[field] == fresh[field], (group, field)
+        # A 304 keeps the stored etag for that endpoint.
+        assert data["_etags"][group] == STALE_ENTRY["_etags"][group]
+        assert "_cached_at" not in data
+
+
+def test_not_modified_does_not_fill_failed_endpoints():
+    data, _ = _enrich_with({"repo": 304, "community": 500})
+    assert data["github_stars"] == STALE_ENTRY["github_stars"]
+    for field in _ETAG_FIELDS["community"]:
+        assert field not in data
+    assert "community" not in data["_etags"]
+
+
+def test_ok_response_replaces_etag():
+    data, sent = _enrich_with({})
+    assert sent == {
+        "repo": "old-repo",
+        "community": "old-community",
+        "participation": "old-participation",
+    }
+    assert data["_etags"] == {
+        "repo": "new-repo",
+        "community": "new-community",
+        "participation": "new-participation",
+    }
+    assert data["github_stars"] == 300
+    assert data["github_owner"] == "o"
+
+
+def test_no_cache_sends_unconditional_requests():
+    data, sent = _enrich_with({}, cached=None)
+    assert sent == {"repo": None, "community": None, "participation": None}
+    assert data["_etags"]["repo"] == "new-repo"
+
+
+def test_etags_never_reach_public_fields():
+    data, _ = _enrich_with({"repo": 304, "community": 304})
+    assert "_etags" in data
+    public = _public_fields({**data, "_cached_at": 2.0})
+    assert "_etags" not in public
+    assert "_cached_at" not in public
+    assert not any(key.startswith("_") for key in public)
+    assert public["github_stars"] == STALE_ENTRY["github_stars"]
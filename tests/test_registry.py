@@ -0,0 +1,72 @@
+"""Tests for the MCP registry collector."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mcp_scorecard.collectors import registry
+
+
+def _page(n: int, last: int) -> dict:
+    return {
+        "servers": [{"name": f"b{n}"}],
+        "metadata": {"nextCursor": str(n + 1) if n < last else None},
+    }
+
+
+def _stub_registry(monkeypatch, log: list[str], normalize) -> None:
+    async def fake_client():
+        return object()
+
+    async def fake_fetch_page(client, url, limit, cursor):
+        log.append(f"fetch-start {cursor}")
+        await asyncio.sleep(0)
+        return _page(int(cursor or 0), last=2)
+
+    monkeypatch.setattr(registry, "get_client", fake_client)
+    monkeypatch.setattr(registry, "_fetch_page", fake_fetch_page)
+    monkeypatch.setattr(registry, "_official", lambda e: {"isLatest": True})
+    monkeypatch.setattr(registry, "_normalize", normalize)
+
+
+def test_collect_starts_next_fetch_before_normalizing(monkeypatch):
+    log: list[str] = []
+
+    def normalize(entry, official):
+        log.append(f"normalize {entry['name']}")
+        return entry
+
+    _stub_registry(monkeypatch, log, normalize)
+    entries = asyncio.run(registry.collect())
+
+    assert [e["name"] for e in entries] == ["b0", "b1", "b2"]
+    assert log == [
+        "fetch-start None",
+        "fetch-start 1",
+        "normalize b0",
+        "fetch-start 2",
+        "normalize b1",
+        "normalize b2",
+    ]
+
+
+def test_collect_cancels_look_ahead_when_normalizing_fails(monkeypatch):
+    log: list[str] = []
+    tasks: list[asyncio.Task] = []
+
+    def normalize(entry, official):
+        current = asyncio.current_task()
+        tasks.extend(t for t in asyncio.all_tasks() if t is not current)
+        raise ValueError("bad entry")
+
+    _stub_registry(monkeypatch, log, normalize)
+
+    async def run():
+        with pytest.raises(ValueError):
+            await registry.collect()
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert tasks and all(t.cancelled() for t in tasks)
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from mcp_scorecard.scoring.calculator import calculate_scores, get_trust_label
+import orjson
+import pytest
+
+from mcp_scorecard.scoring.calculator import (
+    calculate_scores,
+    calculate_scores_bulk,
+    calculate_scores_parallel,
+    get_trust_label,
+)
 from mcp_scorecard.scoring.categories import (
     score_maintenance,
     score_permissions,
@@ -16,9 +23,9 @@ from mcp_scorecard.scoring.categories import (
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-def _load_fixtures() -> list[dict]:
-    with open(FIXTURES / "sample_registry.json") as f:
-        return json.load(f)
+@pytest.fixture(scope="module")
+def servers() -> list[dict]:
+    return orjson.loads((FIXTURES / "sample_registry.json").read_bytes())
 
 
 GOOD_SERVER_GITHUB = {
@@ -64,8 +71,7 @@ def test_trust_label_suspicious():
 # --- Provenance Tests ---
 
 
-def test_provenance_good_server():
-    servers = _load_fixtures()
+def test_provenance_good_server(servers):
     good = servers[0]
     score, signals = score_provenance(good, GOOD_SERVER_GITHUB)
 
@@ -81,8 +87,7 @@ def test_provenance_good_server():
     assert signals["unique_description"] is True
 
 
-def test_provenance_spam_server():
-    servers = _load_fixtures()
+def test_provenance_spam_server(servers):
     spam = servers[1]  # ai.spammy/test-mcp
     score, signals = score_provenance(spam, None)
 
@@ -95,8 +100,7 @@ def test_provenance_spam_server():
 # --- Maintenance Tests ---
 
 
-def test_maintenance_with_github():
-    servers = _load_fixtures()
+def test_maintenance_with_github(servers):
     good = servers[0]
     score, signals = score_maintenance(good, GOOD_SERVER_GITHUB)
 
@@ -105,8 +109,7 @@ def test_maintenance_with_github():
     assert signals["active_commit_weeks"] == 30
 
 
-def test_maintenance_without_github():
-    servers = _load_fixtures()
+def test_maintenance_without_github(servers):
     spam = servers[1]
     score, signals = score_maintenance(spam, None)
 
@@ -117,8 +120,7 @@ def test_maintenance_without_github():
 # --- Popularity Tests ---
 
 
-def test_popularity_with_github():
-    servers = _load_fixtures()
+def test_popularity_with_github(servers):
     good = servers[0]
     score, signals = score_popularity(good, GOOD_SERVER_GITHUB)
 
@@ -127,8 +129,7 @@ def test_popularity_with_github():
     assert signals["github_forks"] == 40
 
 
-def test_popularity_without_github():
-    servers = _load_fixtures()
+def test_popularity_without_github(servers):
     spam = servers[1]
     score, signals = score_popularity(spam, None)
 
@@ -139,8 +140,7 @@ def test_popularity_without_github():
 # --- Permissions Tests ---
 
 
-def test_permissions_safe_server():
-    servers = _load_fixtures()
+def test_permissions_safe_server(servers):
     good = servers[0]  # 1 secret (API_KEY), stdio, api_key pattern
     score, signals = score_permissions(good, GOOD_SERVER_GITHUB)
 
@@ -149,8 +149,7 @@ def test_permissions_safe_server():
     assert signals["transport_type_risk"] == 25  # stdio
 
 
-def test_permissions_dangerous_server():
-    servers = _load_fixtures()
+def test_permissions_dangerous_server(servers):
     db = servers[2]  # 5 secrets, DB_PASSWORD, MASTER_KEY, mixed transport
     score, signals = score_permissions(db, None)
 
@@ -159,8 +158,7 @@ def test_permissions_dangerous_server():
     assert signals["credential_sensitivity"] == 5  # MASTER_KEY = sensitive
 
 
-def test_permissions_no_env_vars():
-    servers = _load_fixtures()
+def test_permissions_no_env_vars(servers):
     smithery = servers[3]  # no env vars, remote only
     score, signals = score_permissions(smithery, None)
 
@@ -171,8 +169,7 @@ def test_permissions_no_env_vars():
 # --- Aggregate Tests ---
 
 
-def test_aggregate_good_server():
-    servers = _load_fixtures()
+def test_aggregate_good_server(servers):
     good = servers[0]
     result = calculate_scores(good, GOOD_SERVER_GITHUB)
 
@@ -184,9 +181,29 @@ def test_aggregate_good_server():
     assert result["trust_score"] >= 50, f"Good server should score decently, got {result['trust_score']}"
 
 
-def test_aggregate_spam_server():
-    servers = _load_fixtures()
+def test_aggregate_spam_server(servers):
     spam = servers[1]
     result = calculate_scores(spam, None)
 
     assert result["trust_score"] <= 30, f"Spam server should score very low, got {result['trust_score']}"
+
+
+def test_bulk_matches_per_server(servers):
+    github = {servers[0]["name"]: GOOD_SERVER_GITHUB}
+    flags = {servers[1]["name"]: ["DESCRIPTION_DUPLICATE"]}
+    results = calculate_scores_bulk(servers, github, flags)
+
+    assert list(results) == [s["name"] for s in servers]
+    for server in servers:
+        name = server["name"]
+        expected = calculate_scores(server, github.get(name), flags.get(name))
+        assert results[name] == expected
+
+
+def test_parallel_matches_bulk(servers):
+    github = {servers[0]["name"]: GOOD_SERVER_GITHUB}
+    flags = {servers[1]["name"]: ["DESCRIPTION_DUPLICATE"]}
+    results = calculate_scores_parallel(servers, github, flags, workers=2)
+
+    assert results == calculate_scores_bulk(servers, github, flags)
+    assert list(results) == [s["name"] for s in servers]